@@ -24,6 +24,10 @@ def main():
     arg_parser.add_argument('-e', '--hyphenation', help='enable hyphenation, requires dictionary', action='store_true')
     arg_parser.add_argument('--lang', help='specify dictionary language e.g. en_US, pl_PL', type=str)
     arg_parser.add_argument('--dict_download', help='allow to download dictionary', action='store_true')
+    arg_parser.add_argument('--lazy_parsing', help='parse chapters on demand', action='store_true')
+    arg_parser.add_argument('--lxml_parser', help='extract chapter text with lxml', action='store_true')
+    arg_parser.add_argument('--parser_workers', help='number of processes parsing the book, 0 for all cores', type=int)
+    arg_parser.add_argument('--max_fps', help='limit redraws while keys are held, 0 for no limit', type=int)
     arg_parser.add_argument('--verbose', help='show output', action='store_true')
     arg_parser.add_argument('FILE', help='path/to/epub/file', nargs='?', default=None)
 
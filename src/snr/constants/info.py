@@ -3,6 +3,7 @@
 APP = 'Simple Novel Reader'
 SHORT_APP = 'SNR'
 VERSION = 'v0.9.212-beta'
+PARSER_VERSION = '4'
 AUTHOR = 'Grzegorz Zygmański'
 EMAIL = 'gzygmanski@hotmail.com'
 SITE = 'https://github.com/gzygmanski/simple-novel-reader'
@@ -33,5 +33,12 @@ BOOKMARK_REMOVE = [ord('x')]
 BOOKMARK_EDIT = [ord('e')]
 BOOKMARK_DESCRIBE = [ord('l'), ord('d')]
 ESCAPE = [curses.KEY_BACKSPACE, 8, 27]
+GOTO = [ord(':')]
+GOTO_NUMBER = [ord(str(x)) for x in range(0, 10)]
+GOTO_PERCENT = [ord('%')]
+FILTER = [ord('/')]
+FILTER_ACCEPT = ['\n', '\r', curses.KEY_ENTER]
+FILTER_CANCEL = ['\x1b']
+FILTER_DELETE = ['\x08', '\x7f', curses.KEY_BACKSPACE]
 REFRESH = [ord('R'), curses.KEY_F5]
 QUIT = [ord('q')]
@@ -11,14 +11,18 @@ CONTACT = _header_line \
 MISSING_KEY = 'Missing key: '
 SAVE_STATE = 'Saving state ...'
 LOAD_STATE = 'Loading state ...'
+SAVE_CACHE = 'Saving book cache ...'
+LOAD_CACHE = 'Loading book cache ...'
 def DICT_INSTALL(target):
     return 'Downloading dictionary: ' + target + ' ...'
 def DICT_INSTALLED(target):
     return target + ': installed'
 def DICT_INSTALL_FAILED(target):
     return 'Failed to download: ' + target
-def ZIP_EXTRACT(target, destination):
-    return 'Extracting file: ' + target + ' to ' + destination + ' ...'
+def ZIP_OPEN(target):
+    return 'Opening file: ' + target + ' ...'
+def PARSE_STATS(parses, hits):
+    return 'Parsed documents: ' + str(parses) + ', cache hits: ' + str(hits)
 def CREATE(target):
     return 'Creating: ' + target + ' ...'
 ERR_NO_PATH = '''\
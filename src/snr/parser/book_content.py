@@ -3,37 +3,108 @@
 from bs4 import BeautifulSoup
 import urllib
 import os
+import re
+import posixpath
 import json
+import bisect
+import atexit
+import concurrent.futures
+import snr.constants.info as Constant
 import snr.constants.messages as Msg
+import snr.utilities as Utilities
+from .document import Document, open_archive, read_document
+from .text_spans import TextSpans
 from langcodes import closest_match, Language
 from hyphen.dictools import is_installed, install
 from hyphen import Hyphenator
 
 class BookContent:
-    def __init__(self, path, toc_file, content_file, dict_download, lang_code=None, verbose=False):
+    def __init__(
+        self,
+        reader,
+        path,
+        toc_file,
+        content_file,
+        dict_download,
+        lang_code=None,
+        verbose=False,
+        cache=None,
+        lazy_parsing=False,
+        lxml_parser=False,
+        parser_workers=None,
+        hyphenation_cache=None
+    ):
+        self.reader = reader
+        self.cache = cache
+        self.hyphenation_cache = hyphenation_cache
+        self.lazy_parsing = lazy_parsing
+        self.lxml_parser = lxml_parser
+        self.parser_workers = parser_workers or os.cpu_count() or 1
         self.path = path
         self.toc_file = toc_file
         self.content_file = content_file
+        self.content_path = posixpath.dirname(content_file)
         self.dict_download = dict_download
         self.verbose = verbose
-        self.heading_tags = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
-        self.paragraph_tags = ['p']
-        self.style_tags = ['span', 'i', 'b', 'em', 'strong', 'a', 'blockquote']
         self.lang_dict = None
         self.lang_code = lang_code
-        self._set_toc_soup()
-        self._set_content_soup()
-        self._set_lang()
+        self.is_parsed = False
+        self.chapters_cache_size = 32
+        self.documents_cache_size = 8
+        self.document_parses = 0
+        self.document_hits = 0
+        self._set_cache_key()
+        self._set_documents()
+        if not self._load_cache():
+            self._set_toc_soup()
+            self._set_content_soup()
+            self._set_title()
+            self._set_lang()
+            self._set_reference_toc()
+            self._set_content_dict()
+            self._set_order_list()
+            self._set_toc_list()
+            self._set_content()
+            if not self.lazy_parsing:
+                self._set_paragraphs()
+            self._save_cache()
+        elif not self.lazy_parsing and not self.is_parsed:
+            self._set_paragraphs()
+            self._save_cache()
+        self._set_chapters()
+        self._set_spans()
+        self._set_toc_index()
         self._set_lang_codes()
         self._set_lang_code()
         self._set_lang_dict()
-        self._set_reference_toc()
-        self._set_content_dict()
-        self._set_order_list()
-        self._set_toc_list()
-        self._set_content()
-        self._set_paragraphs()
 
+    def _set_cache_key(self):
+        self.cache_key = self.reader.get_file_hash() + '-' + Constant.PARSER_VERSION
+
+    def _load_cache(self):
+        if self.cache is None:
+            return False
+        book = self.cache.load(self.cache_key)
+        if book is None:
+            return False
+        self.title = book['title']
+        self.lang = book['lang']
+        self.toc_list = book['toc_list']
+        self.is_parsed = book['is_parsed']
+        return True
+
+    def _save_cache(self):
+        if self.cache is not None:
+            self.cache.save(self.cache_key, {
+                'title': self.title,
+                'lang': self.lang,
+                'toc_list': self.toc_list,
+                'is_parsed': self.is_parsed
+            })
+
+    def _save_hyphenation(self, memo):
+        if memo.has_changed():
+            self.hyphenation_cache.save(self.lang_code, memo.get_words())
 
     def _set_toc_soup(self):
         self.toc_soup = self.make_soup(self.toc_file, 'xml')
@@ -41,6 +112,9 @@ class BookContent:
     def _set_content_soup(self):
         self.content_soup = self.make_soup(self.content_file, 'xml')
 
+    def _set_title(self):
+        self.title = self.content_soup.find('title').text
+
     def _set_lang(self):
         self.lang = self.content_soup.find('dc:language').text
 
@@ -65,7 +139,7 @@ class BookContent:
                     if self.verbose:
                         print(Msg.DICT_INSTALL(self.lang_code))
                     install(self.lang_code)
-                self.lang_dict = Hyphenator(self.lang_code)
+                self.lang_dict = self._get_hyphenator(Hyphenator(self.lang_code))
             except:
                 pass
             if self.verbose:
@@ -80,10 +154,7 @@ class BookContent:
             for item in self.content_soup.guide.find_all('reference'):
                 if item['type'] == 'toc':
                     reference = item['href'].split('#')
-                    self.reference_toc_src = os.path.join(
-                        self.path,
-                        urllib.parse.unquote(reference[0])
-                    )
+                    self.reference_toc_src = self._get_src(self.content_path, reference[0])
                     try:
                         self.reference_toc_id = reference[1]
                     except IndexError:
@@ -101,7 +172,7 @@ class BookContent:
             for item in self.content_soup.find_all('item'):
                 if item.has_attr('media-type') and item['media-type'] == 'application/xhtml+xml':
                     content_id = item['id']
-                    content_src = os.path.join(self.path, urllib.parse.unquote(item['href']))
+                    content_src = self._get_src(self.content_path, item['href'])
                     if content_src != self.reference_toc_src or self.reference_toc_id is not None:
                         self.content_dict[content_id] = content_src
                     else:
@@ -127,13 +198,14 @@ class BookContent:
 
     def _set_toc_list(self):
         self.toc_list = []
+        content_srcs = set(self.content_dict.values())
         index = 0
         try:
             for index, nav_item in enumerate(self.toc_soup.navMap.find_all(recursive=True)):
                 if nav_item.name == 'navPoint':
                     toc_name = nav_item.select('navLabel > text')[0].string
                     toc_content = nav_item.content['src'].split('#')
-                    toc_content[0] = os.path.join(self.path, urllib.parse.unquote(toc_content[0]))
+                    toc_content[0] = self._get_src(self.path, toc_content[0])
                     if len(toc_content) == 2:
                         toc_inner_id = toc_content[1]
                     else:
@@ -145,7 +217,7 @@ class BookContent:
                         'text': [],
                         'is_container': False
                     }
-                    if toc_dict['src'][0] in list(self.content_dict.values()):
+                    if toc_dict['src'][0] in content_srcs:
                         self.toc_list.append(toc_dict)
             for i in range(len(self.toc_list)):
                 try:
@@ -165,68 +237,163 @@ class BookContent:
             exit()
 
     def _set_content(self):
+        spine = [self.content_dict[idref] for idref in self.order_list if idref in self.content_dict]
+        positions = {}
+        for position, src in enumerate(spine):
+            positions.setdefault(src, []).append(position)
         paths_continue = False
+        for index, item in enumerate(self.toc_list):
+            if paths_continue:
+                start = 0
+            elif item['src'][0] in positions:
+                start = positions[item['src'][0]][0]
+            else:
+                continue
+            if index == len(self.toc_list) - 1:
+                paths_continue = False
+                continue
+            end = self._get_position(positions, self.toc_list[index + 1]['src'][0], start)
+            if end is None:
+                item['src'].extend(spine[start:])
+                paths_continue = True
+            else:
+                item['src'].extend(spine[start:end])
+                paths_continue = False
+            if len(item['src']) > 1 and item['src'][0] == item['src'][1]:
+                item['src'].pop(0)
+
+    def _set_documents(self):
+        if self.lazy_parsing:
+            self.documents = Utilities.LruCache(self.documents_cache_size)
+        else:
+            self.documents = Utilities.LruCache(None)
+
+    def _set_parsed_documents(self):
+        paths = []
+        for item in self.toc_list:
+            if not item['is_container']:
+                for path in item['src']:
+                    if path not in paths:
+                        paths.append(path)
+        workers = min(self.parser_workers, len(paths))
+        if workers < 2:
+            return
         try:
-            for index in range(len(self.toc_list)):
-                for idref in self.order_list:
-                    if self.toc_list[index]['src'][0] == self.content_dict[idref]:
-                        paths_continue = True
-                    if paths_continue:
-                        if index != len(self.toc_list) - 1 and \
-                            self.toc_list[index + 1]['src'][0] != self.content_dict[idref]:
-                            self.toc_list[index]['src'].append(self.content_dict[idref])
-                        else:
-                            paths_continue = False
-                            break
-                if len(self.toc_list[index]['src']) > 1 and self.toc_list[index]['src'][0] == \
-                    self.toc_list[index]['src'][1]:
-                    self.toc_list[index]['src'].pop(0)
-        except AttributeError:
-            print(Msg.HEADER)
-            print(Msg.ERR_PARSER_FAILED)
-            exit()
+            with concurrent.futures.ProcessPoolExecutor(
+                workers,
+                initializer=open_archive,
+                initargs=(self.reader.get_file_path(),)
+            ) as executor:
+                documents = executor.map(
+                    read_document,
+                    paths,
+                    [self.lxml_parser] * len(paths),
+                    chunksize=max(1, len(paths) // (workers * 4))
+                )
+                for path, document in zip(paths, documents):
+                    self.documents.set(path, document)
+                    self.document_parses += 1
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            self.documents.clear()
+            self.document_parses = 0
 
     def _set_paragraphs(self):
-        current_file = ''
-        current_heading = ''
-        current_id = ''
+        self._set_parsed_documents()
         has_content = False
+        current_id = ''
         for item in self.toc_list:
             if not item['is_container']:
-                for document in item['src']:
-                    new_file = document
-                    current_heading = item['name']
-                    if item['inner_id'] is not None:
-                        current_id = item['inner_id']
-                    if new_file != current_file:
-                        soup = self.make_soup(document, 'html.parser')
-                        current_file = new_file
-                    if soup.body.find_all('p') == []:
-                        if 'div' not in self.paragraph_tags:
-                            self.paragraph_tags.append('div')
-                    else:
-                        if 'div' in self.paragraph_tags:
-                            self.paragraph_tags.remove('div')
-                    for tag in soup.body.find_all():
-                        try:
-                            if tag.name in self.heading_tags or tag.has_attr('id'):
-                                if tag.text == current_heading or tag['id'] == current_id:
-                                    has_content = True
-                                else:
-                                    has_content = False
-                        except KeyError:
-                            has_content = False
-                        if item['inner_id'] is None or has_content:
-                            if tag.name in self.paragraph_tags:
-                                if tag.text.lstrip() != '' and tag.text.lstrip() != '\xa0':
-                                    item['text'].append(tag.text.lstrip())
-                            if tag.name in self.style_tags \
-                                and (tag.parent.name not in self.paragraph_tags \
-                                and tag.parent.name not in self.style_tags):
-                                if tag.text.lstrip() != '' and tag.text.lstrip() != '\xa0':
-                                    item['text'].append(
-                                        tag.text.lstrip()
-                                    )
+                if item['inner_id'] is not None:
+                    current_id = item['inner_id']
+                item['text'], has_content = self._get_paragraphs(item, current_id, has_content)
+        self.is_parsed = True
+        if self.verbose:
+            print(Msg.PARSE_STATS(self.document_parses, self.document_hits))
+        self.documents.clear()
+
+    def _set_chapters(self):
+        self.chapters = Utilities.LruCache(self.chapters_cache_size)
+
+    def _set_spans(self):
+        after = ['\n', ' ', '.', ',',  ';', ':', '!', '?', '-', '—']
+        speech_close = ['\'', '"', '’', '”']
+        info_close = ['>', ')', ']', '}']
+        self.speech_spans = TextSpans(['\'', '"', '‘', '“'], speech_close, after + speech_close)
+        self.info_spans = TextSpans(['<', '(', '[', '{'], info_close, \
+            after + info_close + speech_close)
+        self.spans = Utilities.LruCache(self.chapters_cache_size)
+
+    def _set_toc_index(self):
+        self.toc_index = [(chapter['name'] or '').lower() for chapter in self.toc_list]
+
+    def _get_hyphenator(self, hyphenator):
+        if self.hyphenation_cache is None:
+            return hyphenator
+        memo = Utilities.HyphenationMemo(hyphenator, self.hyphenation_cache.load(self.lang_code))
+        atexit.register(self._save_hyphenation, memo)
+        return memo
+
+    def _get_document(self, path):
+        document = self.documents.get(path)
+        if document is None:
+            document = Document(self.reader.read_file(path), self.lxml_parser)
+            self.documents.set(path, document)
+            self.document_parses += 1
+        else:
+            self.document_hits += 1
+        return document
+
+    def _get_paragraphs(self, item, current_id, has_content):
+        paragraphs = []
+        for path in item['src']:
+            document = self._get_document(path)
+            paragraphs.extend(document.get_paragraphs(item['name'], item['inner_id'], has_content))
+            has_content = document.has_content(item['name'], current_id, has_content)
+        return paragraphs, has_content
+
+    def _get_current_id(self, chapter):
+        for item in reversed(self.toc_list[:chapter + 1]):
+            if not item['is_container'] and item['inner_id'] is not None:
+                return item['inner_id']
+        return ''
+
+    def _get_previous_content(self, chapter):
+        for index in range(chapter - 1, -1, -1):
+            item = self.toc_list[index]
+            if item['is_container']:
+                continue
+            for path in reversed(item['src']):
+                document = self._get_document(path)
+                if document.last_marker is not None:
+                    return document.has_content(item['name'], self._get_current_id(index))
+        return False
+
+    def _get_chapter_paragraphs(self, chapter):
+        item = self.toc_list[chapter]
+        has_content = False
+        if item['inner_id'] is not None and self._has_prefix(item):
+            has_content = self._get_previous_content(chapter)
+        return self._get_paragraphs(item, item['inner_id'], has_content)[0]
+
+    def _has_prefix(self, item):
+        for path in item['src']:
+            document = self._get_document(path)
+            if len(document.prefix) != 0:
+                return True
+            if document.last_marker is not None:
+                return False
+        return False
+
+    def _get_position(self, positions, src, start):
+        if src not in positions:
+            return None
+        index = bisect.bisect_left(positions[src], start)
+        if index == len(positions[src]):
+            return None
+        return positions[src][index]
+
+    def _get_src(self, path, href):
+        return posixpath.normpath(posixpath.join(path, urllib.parse.unquote(href)))
 
     def _get_lang_codes(self, lang_code, data):
         langs = data[lang_code]
@@ -247,6 +414,22 @@ class BookContent:
             toc[chapter['id']] = chapter['name']
         return toc
 
+    def get_toc_matches(self, query, positions=None):
+        query = query.lower()
+        if positions is None:
+            positions = range(len(self.toc_index))
+        if query == '':
+            return list(positions)
+        fuzzy = re.compile('.*?'.join(re.escape(character) for character in query))
+        matches = []
+        fuzzy_matches = []
+        for position in positions:
+            if query in self.toc_index[position]:
+                matches.append(position)
+            elif fuzzy.search(self.toc_index[position]):
+                fuzzy_matches.append(position)
+        return matches + sorted(fuzzy_matches)
+
     def get_number_of_chapters(self):
         return len(self.toc_list)
 
@@ -254,7 +437,7 @@ class BookContent:
         return self.toc_list[chapter]['id']
 
     def get_document_title(self):
-        return self.content_soup.find('title').text
+        return self.title
 
     def get_document_language(self):
         return self.lang_code
@@ -263,21 +446,42 @@ class BookContent:
         return self.toc_list[chapter]['name']
 
     def get_chapter_text(self, chapter):
-        return self.toc_list[chapter]['text']
+        if self.is_parsed:
+            return self.toc_list[chapter]['text']
+        text = self.chapters.get(chapter)
+        if text is None:
+            item = self.toc_list[chapter]
+            text = [] if item['is_container'] else self._get_chapter_paragraphs(chapter)
+            self.chapters.set(chapter, text)
+        return text
+
+    def get_chapter_spans(self, chapter):
+        spans = self.spans.get(chapter)
+        if spans is None:
+            spans = [self.get_text_spans(text) for text in self.get_chapter_text(chapter)]
+            self.spans.set(chapter, spans)
+        return spans
+
+    def get_text_spans(self, text):
+        return {
+            'speech': self.speech_spans.get_spans(text),
+            'info': self.info_spans.get_spans(text)
+        }
 
     def has_text(self, chapter):
         try:
-            return False if len(self.toc_list[chapter]['text']) == 0 else True
+            return False if len(self.get_chapter_text(chapter)) == 0 else True
         except IndexError:
             return False
 
     def has_dict(self):
         return True if self.lang_dict is not None else False
 
+    def is_lazy_parsing(self):
+        return self.lazy_parsing
+
     def is_dict_installed(self):
         return is_installed(self.lang_code)
 
     def make_soup(self, path, parser):
-        with open(path) as f:
-            doc = f.read()
-        return BeautifulSoup(doc, parser)
+        return BeautifulSoup(self.reader.read_file(path), parser)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+import zipfile
+from io import BytesIO
+from bs4 import BeautifulSoup
+from lxml import etree
+
+archive = None
+
+def open_archive(file_path):
+    global archive
+    archive = zipfile.ZipFile(file_path, 'r')
+
+def read_document(path, lxml_parser=False):
+    return Document(archive.read(path), lxml_parser)
+
+class Document:
+    def __init__(self, markup, lxml_parser=False):
+        self.heading_tags = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+        self.paragraph_tags = ['p']
+        self.style_tags = ['span', 'i', 'b', 'em', 'strong', 'a', 'blockquote']
+        self.preserve_tags = ['pre', 'textarea']
+        self.script_tags = ['script', 'style', 'template']
+        self.ascii_spaces = '\x20\x0a\x09\x0c\x0d'
+        tokens = None
+        if lxml_parser:
+            tokens = self._get_lxml_tokens(markup)
+        if tokens is None:
+            tokens = self._get_tokens(BeautifulSoup(markup, 'html.parser'))
+        self._set_segments(tokens)
+
+    def _set_segments(self, tokens):
+        self.paragraphs = []
+        self.prefix = []
+        self.segments = []
+        self.names = {}
+        self.ids = {}
+        self.last_marker = None
+        segment = self.prefix
+        for is_marker, text, tag_id, paragraph in tokens:
+            if is_marker:
+                index = len(self.segments)
+                segment = []
+                self.segments.append(segment)
+                self.names.setdefault(text, []).append(index)
+                if tag_id is not None:
+                    self.ids.setdefault(tag_id, []).append(index)
+                self.last_marker = (text, tag_id)
+            if paragraph is not None:
+                segment.append(paragraph)
+                self.paragraphs.append(paragraph)
+
+    def _get_tokens(self, soup):
+        if soup.body is None:
+            return
+        paragraph_tags = self._get_paragraph_tags(soup.body.find_all('p') != [])
+        for tag in soup.body.find_all():
+            is_marker = self._is_marker(tag.name, tag.get('id'))
+            is_paragraph = self._is_paragraph(tag.name, tag.parent.name, paragraph_tags)
+            if is_marker or is_paragraph:
+                yield self._get_token(is_marker, is_paragraph, tag.text, tag.get('id'))
+
+    def _get_lxml_tokens(self, markup):
+        if isinstance(markup, str):
+            markup = markup.encode('utf-8')
+        if b'\r' in markup:
+            return None
+        text_tags = self.heading_tags + self.paragraph_tags + self.style_tags + ['div']
+        elements = []
+        indexes = {}
+        texts = {}
+        preserve = 0
+        body = None
+        try:
+            for event, element in etree.iterparse(
+                BytesIO(markup),
+                events=('start', 'end'),
+                remove_pis=True
+            ):
+                if body is None:
+                    if event == 'start' and self._get_name(element) == 'body':
+                        body = element
+                    continue
+                name = self._get_name(element)
+                if event == 'start':
+                    if name in self.preserve_tags:
+                        preserve += 1
+                    if element is not body:
+                        indexes[element] = len(elements)
+                        elements.append([
+                            name,
+                            self._get_name(element.getparent()),
+                            element.get('id'),
+                            None
+                        ])
+                    continue
+                parts = [self._get_string(element.text, preserve)]
+                for child in element:
+                    if isinstance(child.tag, str):
+                        text = texts.pop(child)
+                        if self._get_name(child) not in self.script_tags:
+                            parts.append(text)
+                    parts.append(self._get_string(child.tail, preserve))
+                del element[:]
+                if name in self.preserve_tags:
+                    preserve -= 1
+                if element is body:
+                    break
+                texts[element] = ''.join(parts)
+                item = elements[indexes.pop(element)]
+                if item[0] in text_tags or item[2] is not None:
+                    item[3] = texts[element]
+        except etree.XMLSyntaxError:
+            return None
+        tokens = []
+        paragraph_tags = self._get_paragraph_tags(any(item[0] == 'p' for item in elements))
+        for name, parent_name, tag_id, text in elements:
+            is_marker = self._is_marker(name, tag_id)
+            is_paragraph = self._is_paragraph(name, parent_name, paragraph_tags)
+            if is_marker or is_paragraph:
+                tokens.append(self._get_token(is_marker, is_paragraph, text, tag_id))
+        return tokens
+
+    def _get_name(self, element):
+        return element.tag.rpartition('}')[2].lower()
+
+    def _get_string(self, text, preserve):
+        if not text:
+            return ''
+        if preserve == 0 and text.strip(self.ascii_spaces) == '':
+            return '\n' if '\n' in text else ' '
+        return text
+
+    def _get_paragraph_tags(self, has_paragraphs):
+        if not has_paragraphs:
+            return self.paragraph_tags + ['div']
+        return self.paragraph_tags
+
+    def _get_token(self, is_marker, is_paragraph, text, tag_id):
+        paragraph = text.lstrip() if is_paragraph else ''
+        return (
+            is_marker,
+            text if is_marker else None,
+            tag_id,
+            paragraph if paragraph != '' and paragraph != '\xa0' else None
+        )
+
+    def _is_marker(self, name, tag_id):
+        return name in self.heading_tags or tag_id is not None
+
+    def _is_paragraph(self, name, parent_name, paragraph_tags):
+        return name in paragraph_tags \
+            or (name in self.style_tags \
+            and parent_name not in paragraph_tags \
+            and parent_name not in self.style_tags)
+
+    def _is_match(self, marker, heading, inner_id):
+        text, tag_id = marker
+        return text == heading or (tag_id is not None and tag_id == inner_id)
+
+    def get_paragraphs(self, heading, inner_id, has_content=False):
+        if inner_id is None:
+            return list(self.paragraphs)
+        paragraphs = list(self.prefix) if has_content else []
+        markers = set(self.names.get(heading, []))
+        markers.update(self.ids.get(inner_id, []))
+        for index in sorted(markers):
+            paragraphs.extend(self.segments[index])
+        return paragraphs
+
+    def has_content(self, heading, current_id, has_content=False):
+        if self.last_marker is None:
+            return has_content
+        return self._is_match(self.last_marker, heading, current_id)
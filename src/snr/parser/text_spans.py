@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+import re
+
+class TextSpans:
+    def __init__(self, opening_marks, closing_marks, closing_after):
+        self.opening_marks = opening_marks
+        self.closing_marks = closing_marks
+        self.whitespace = ' \t\n\r\x0b\x0c'
+        self.closing_after = set(closing_after) | set(self.whitespace)
+        self.marks = re.compile('[' + re.escape(''.join(opening_marks + closing_marks)) + ']')
+
+    def get_spans(self, text):
+        spans = []
+        is_opened = False
+        for match in self.marks.finditer(text):
+            x = match.start()
+            character = text[x]
+            if character in self.opening_marks \
+                and not is_opened \
+                and (x == 0 or text[x - 1] in self.whitespace):
+                is_opened = True
+                start = x
+                closing_mark = self.closing_marks[self.opening_marks.index(character)]
+            if is_opened and character == closing_mark:
+                if x == len(text) - 1 or text[x + 1] in self.closing_after:
+                    is_opened = False
+                    spans.append([start, x])
+        if is_opened:
+            spans.append([start, len(text.rstrip(self.whitespace)) - 1])
+        return spans
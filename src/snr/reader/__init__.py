@@ -3,3 +3,5 @@
 from .file_reader import FileReader
 from .config_reader import ConfigReader
 from .state_reader import StateReader
+from .book_cache_reader import BookCacheReader
+from .hyphenation_cache_reader import HyphenationCacheReader
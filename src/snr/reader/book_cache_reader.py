@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import os
+import gzip
+import json
+import snr.constants.messages as Msg
+from .cache import Cache
+
+class BookCacheReader(Cache):
+    def __init__(self, verbose=False):
+        Cache.__init__(self, verbose)
+        self.max_age = 60 * 60 * 24 * 30
+        self.max_temp_age = 60 * 60
+        self._set_books_dir()
+        self.clean(self.books_dir, self.max_age)
+        self.clean(self.books_dir, self.max_temp_age, '.tmp')
+
+    def _set_books_dir(self):
+        self.books_dir = os.path.join(self.cache_dir, 'books')
+        if not os.path.exists(self.books_dir):
+            try:
+                os.mkdir(self.books_dir, self.access_rights)
+            except OSError:
+                pass
+
+    def _get_book_file(self, key):
+        return os.path.join(self.books_dir, key + '.json.gz')
+
+    def load(self, key):
+        book_file = self._get_book_file(key)
+        try:
+            with gzip.open(book_file, 'rt', encoding='utf-8') as f:
+                if self.verbose:
+                    print(Msg.LOAD_CACHE)
+                book = json.load(f)
+            os.utime(book_file)
+            return book
+        except (OSError, ValueError, EOFError):
+            return None
+
+    def save(self, key, book):
+        if self.verbose:
+            print(Msg.SAVE_CACHE)
+        data = json.dumps(book, separators=(',', ':')).encode('utf-8')
+        try:
+            self.write(self._get_book_file(key), gzip.compress(data))
+        except OSError:
+            pass
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import os
+import time
+import tempfile
+import appdirs
+import snr.constants.messages as Msg
+
+class Cache:
+    def __init__(self, verbose=False, access_rights=0o755):
+        self.verbose = verbose
+        self.access_rights = access_rights
+        self._set_cache_dir()
+
+    def _set_cache_dir(self):
+        self.cache_dir = appdirs.user_cache_dir('snr')
+        if not os.path.exists(self.cache_dir):
+            try:
+                if self.verbose:
+                    print(Msg.CREATE(self.cache_dir))
+                os.makedirs(self.cache_dir, self.access_rights)
+            except OSError:
+                print ("Creation of the directory %s failed" % self.cache_dir)
+
+    def clean(self, directory, max_age, suffix=''):
+        now = time.time()
+        try:
+            files = os.listdir(directory)
+        except OSError:
+            return
+        for filename in files:
+            if not filename.endswith(suffix):
+                continue
+            file_path = os.path.join(directory, filename)
+            try:
+                if now - os.path.getmtime(file_path) > max_age:
+                    os.unlink(file_path)
+            except OSError:
+                pass
+
+    def write(self, file_path, data):
+        directory = os.path.dirname(file_path)
+        with tempfile.NamedTemporaryFile(dir=directory, suffix='.tmp', delete=False) as f:
+            f.write(data)
+        try:
+            os.replace(f.name, file_path)
+        except OSError:
+            os.unlink(f.name)
+            raise
@@ -32,6 +32,10 @@ class ConfigReader(Config):
                 'justify_full': 'off',
                 'hyphenation': 'off',
                 'dict_download': 'on',
+                'lazy_parsing': 'off',
+                'lxml_parser': 'off',
+                'parser_workers': '0',
+                'max_fps': '0',
                 'horizontal_padding': '2',
                 'vertical_padding': '2',
                 'pe_multiplier': '0.2'
@@ -76,6 +80,18 @@ class ConfigReader(Config):
     def get_dict_download(self):
         return bool(strtobool(self.config[self.general_section]['dict_download']))
 
+    def get_lazy_parsing(self):
+        return bool(strtobool(self.config[self.general_section].get('lazy_parsing', 'off')))
+
+    def get_lxml_parser(self):
+        return bool(strtobool(self.config[self.general_section].get('lxml_parser', 'off')))
+
+    def get_parser_workers(self):
+        return int(self.config[self.general_section].get('parser_workers', '0'))
+
+    def get_max_fps(self):
+        return int(self.config[self.general_section].get('max_fps', '0'))
+
     def get_horizontal_padding(self):
         return int(self.config[self.general_section]['horizontal_padding'])
 
@@ -1,79 +1,135 @@
 #!/usr/bin/env python3
 
 import os
-import tempfile
-import shutil
+import atexit
+import hashlib
+import posixpath
+import urllib
 import zipfile
-from pathlib import Path
 import snr.constants.messages as Msg
+from io import BytesIO
+from lxml import etree
 
 class FileReader:
-    def __init__(self, file_path, verbose=False, access_rights=0o755):
+    def __init__(self, file_path, verbose=False):
         self.file_path = file_path
         self.verbose = verbose
-        self.access_rights = access_rights
-        self._set_path()
-        self._set_temp_dir()
-        self._unzip_file()
-
-    def _set_path(self):
-        self.path = os.path.join(tempfile.gettempdir(), 'snr/')
-
-    def _set_temp_dir(self):
-        if not os.path.exists(self.path):
-            try:
-                if self.verbose:
-                    print(Msg.CREATE(self.path))
-                os.mkdir(self.path, self.access_rights)
-            except OSError:
-                print(Msg.HEADER)
-                print("Creation of the directory %s failed" % self.path)
-                exit()
-        else:
-            for filename in os.listdir(self.path):
-                file_path = os.path.join(self.path, filename)
-                try:
-                    if os.path.isfile(file_path) or os.path.islink(file_path):
-                        os.unlink(file_path)
-                    elif os.path.isdir(file_path):
-                        shutil.rmtree(file_path)
-                except OSError as e:
-                    print(Msg.HEADER)
-                    print('Failed to delete %s, because of %s' % (file_path, e))
-                    exit()
-
-    def _unzip_file(self):
+        self._set_archive()
+        self._set_files()
+        self._set_content_path()
+
+    def _set_archive(self):
         try:
-            with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
-                if self.verbose:
-                    print(Msg.ZIP_EXTRACT(self.file_path, self.path))
-                zip_ref.extractall(self.path)
-        except IsADirectoryError as e:
+            if self.verbose:
+                print(Msg.ZIP_OPEN(self.file_path))
+            self.archive = zipfile.ZipFile(self.file_path, 'r')
+            atexit.register(self.close)
+        except (IsADirectoryError, zipfile.BadZipFile):
             print(Msg.HEADER)
             print(Msg.ERR_INVALID_PATH)
             exit()
 
+    def _set_files(self):
+        self.files = self.archive.namelist()
+        self.container_file = 'META-INF/container.xml'
+        self.content_media_type = 'application/oebps-package+xml'
+        self.toc_media_type = 'application/x-dtbncx+xml'
+
+    def _set_content_path(self):
+        self.content_path = self._find_content_file() or self._find_file('.opf')
+
+    def _find_file(self, extension):
+        for path in self.files:
+            if path.endswith(extension):
+                return path
+        return None
+
+    def _find_content_file(self):
+        if self.container_file not in self.files:
+            return None
+        for name, rootfile in self._get_elements(self.container_file, ['rootfile']):
+            if name == 'rootfile' \
+                and rootfile.get('media-type', self.content_media_type) == self.content_media_type \
+                and rootfile.get('full-path') in self.files:
+                return rootfile.get('full-path')
+        return None
+
+    def _find_toc_file(self, content_path):
+        items = []
+        toc_id = None
+        for name, element in self._get_elements(content_path, ['item', 'spine']):
+            if name == 'item':
+                items.append(element)
+            elif name == 'spine':
+                toc_id = element.get('toc')
+                if len(items) != 0:
+                    break
+        toc_path = None
+        for item in items:
+            is_toc = toc_id is not None and item.get('id') == toc_id
+            if is_toc or item.get('media-type') == self.toc_media_type:
+                path = posixpath.normpath(posixpath.join(
+                    posixpath.dirname(content_path),
+                    urllib.parse.unquote(item.get('href', ''))
+                ))
+                if path in self.files:
+                    if is_toc or toc_id is None:
+                        return path
+                    if toc_path is None:
+                        toc_path = path
+        return toc_path
+
+    def _get_elements(self, path, names):
+        try:
+            for event, element in etree.iterparse(
+                BytesIO(self.read_file(path)),
+                events=('start',),
+                tag=['{*}' + name for name in names],
+                recover=True
+            ):
+                yield element.tag.rpartition('}')[2], element
+        except etree.XMLSyntaxError:
+            return
+
     def get_toc_file(self):
         toc_path = None
-        for path in Path(self.path).rglob('*.ncx'):
-            toc_path = path
-            break
+        if self.content_path is not None:
+            toc_path = self._find_toc_file(self.content_path)
+        if toc_path is None:
+            toc_path = self._find_file('.ncx')
         if toc_path is None:
             print(Msg.HEADER)
             print(Msg.ERR_TOC_NOT_FOUND)
             exit()
-        return str(path)
+        return toc_path
 
     def get_content_file(self):
-        content_path = None
-        for path in Path(self.path).rglob('*.opf'):
-            content_path = path
-            break
-        if content_path is None:
+        if self.content_path is None:
             print(Msg.HEADER)
             print(Msg.ERR_CONTENT_NOT_FOUND)
             exit()
-        return str(path)
+        return self.content_path
 
     def get_directory_path(self, toc_path):
-        return toc_path[:toc_path.rfind('/')]
+        return posixpath.dirname(toc_path)
+
+    def close(self):
+        self.archive.close()
+
+    def get_file_path(self):
+        return self.file_path
+
+    def get_file_hash(self):
+        stat = os.stat(self.file_path)
+        file_hash = hashlib.sha1()
+        file_hash.update('{}:{}'.format(stat.st_size, stat.st_mtime_ns).encode('utf-8'))
+        for info in self.archive.infolist():
+            file_hash.update('{}:{}:{}'.format(
+                info.filename,
+                info.CRC,
+                info.file_size
+            ).encode('utf-8'))
+        return file_hash.hexdigest()
+
+    def read_file(self, path):
+        return self.archive.read(path)
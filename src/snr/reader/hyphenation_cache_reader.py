@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+import os
+import gzip
+import json
+from .cache import Cache
+
+class HyphenationCacheReader(Cache):
+    def __init__(self, verbose=False):
+        Cache.__init__(self, verbose)
+        self.max_temp_age = 60 * 60
+        self._set_hyphenation_dir()
+        self.clean(self.hyphenation_dir, self.max_temp_age, '.tmp')
+
+    def _set_hyphenation_dir(self):
+        self.hyphenation_dir = os.path.join(self.cache_dir, 'hyphenation')
+        if not os.path.exists(self.hyphenation_dir):
+            try:
+                os.mkdir(self.hyphenation_dir, self.access_rights)
+            except OSError:
+                pass
+
+    def _get_hyphenation_file(self, lang_code):
+        return os.path.join(self.hyphenation_dir, lang_code + '.json.gz')
+
+    def load(self, lang_code):
+        try:
+            with gzip.open(self._get_hyphenation_file(lang_code), 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError, EOFError):
+            return None
+
+    def save(self, lang_code, words):
+        data = json.dumps(words, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        try:
+            self.write(self._get_hyphenation_file(lang_code), gzip.compress(data))
+        except OSError:
+            pass
@@ -2,6 +2,7 @@
 
 import os
 import json
+import tempfile
 import snr.constants.messages as Msg
 from .config import Config
 
@@ -24,6 +25,7 @@ class StateReader(Config):
             self.state = {'default': {}}
 
     def save(self, path, title, chapter, index, quickmarks, bookmarks):
+        self._set_state()
         new_key = self.key_parser(title)
         self.state['default']['path'] = path
         self.state['default']['title'] = title
@@ -39,10 +41,17 @@ class StateReader(Config):
             'quickmarks': quickmarks,
             'bookmarks': bookmarks
         }
-        with open (self.state_file, 'w') as f:
+        with tempfile.NamedTemporaryFile(
+            'w',
+            dir=self.config_dir,
+            suffix='.tmp',
+            delete=False
+        ) as f:
             if self.verbose:
                 print(Msg.SAVE_STATE)
             json.dump(self.state, f, indent=2)
+        os.chmod(f.name, 0o644)
+        os.replace(f.name, self.state_file)
 
     def exists(self, title):
         if self.key_parser(title) in self.state.keys():
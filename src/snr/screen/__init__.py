@@ -2,6 +2,7 @@
 
 from .screen import Screen
 from .content_pages import ContentPages
+from .layout_cache import LayoutCache
 from .toc_pages import TocPages
 from .help_pages import HelpPages
 from .bookmark_pages import BookmarkPages
@@ -47,6 +47,7 @@ class BookmarkPages(Pages):
 
     def _set_pages(self):
         bookmarks = self.bookmarks.get_bookmarks()
+        self.version = self.bookmarks.get_version()
         self.pages = []
         page = []
         lines = 0
@@ -76,6 +77,10 @@ class BookmarkPages(Pages):
     def get_number_of_positions(self, current_page):
         return len(self.pages[current_page])
 
+    def is_outdated(self, screen, modes, v_padding, h_padding):
+        return super().is_outdated(screen, modes, v_padding, h_padding) \
+            or self.version != self.bookmarks.get_version()
+
     def get_position_id(self, current_page, current_pos):
         return self.pages[current_page][current_pos]['id']
 
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import bisect
+from textwrap2 import wrap as wrap2
+import snr.utilities as Utilities
+
+class ChapterLines:
+    def __init__(
+        self,
+        book,
+        chapter,
+        page_columns,
+        hyphenation,
+        justify_full
+    ):
+        self.book = book
+        self.chapter = chapter
+        self.page_columns = page_columns
+        self.hyphenation = hyphenation
+        self.justify_full = justify_full
+        self.line_breaker = Utilities.LineBreaker(page_columns)
+        self.content = None
+        self.paragraphs = {}
+        self.title = None
+        self.spans = {}
+        self.whitespace = ' \t\n\r\x0b\x0c'
+
+    # :::: GETTERS ::::::::::::::::: #
+
+    def _get_content(self):
+        if self.content is None:
+            self.content = self.book.get_chapter_text(self.chapter)
+        return self.content
+
+    def get_number_of_paragraphs(self):
+        return len(self._get_content())
+
+    def get_lines(self, index):
+        lines = self.paragraphs.get(index)
+        if lines is None:
+            lines = self._get_justified(self._wrap(self._get_content()[index]))
+            self.paragraphs[index] = lines
+        return lines
+
+    def get_title_lines(self):
+        if self.title is None:
+            self.title = self._get_justified(self._wrap(self.book.get_chapter_title(self.chapter)))
+        return self.title
+
+    def get_spans(self, index, kind):
+        spans = self.spans.get((index, kind))
+        if spans is None:
+            if index is None:
+                text = self.book.get_chapter_title(self.chapter) + '\n* * *'
+                lines = self.get_title_lines() + ['* * *']
+                text_spans = self.book.get_text_spans(text)[kind]
+            else:
+                text = self._get_content()[index]
+                lines = self.get_lines(index)
+                text_spans = self.book.get_chapter_spans(self.chapter)[index][kind]
+            spans = self._get_line_spans(self._get_offsets(lines, text), text_spans)
+            self.spans[(index, kind)] = spans
+        return spans
+
+    def _get_offsets(self, lines, text):
+        offsets = []
+        position = 0
+        for number, line in enumerate(lines):
+            if number > 0:
+                while position < len(text) and text[position] in self.whitespace:
+                    position += 1
+            if text.startswith(line, position):
+                offsets.append(range(position, position + len(line)))
+                position += len(line)
+                continue
+            line_offsets = []
+            for character in line:
+                if position < len(text) and (character == text[position] \
+                    or character == ' ' and text[position] in self.whitespace):
+                    line_offsets.append(position)
+                    position += 1
+                else:
+                    line_offsets.append(max(position - 1, 0))
+            offsets.append(line_offsets)
+        return offsets
+
+    def _get_line_spans(self, offsets, text_spans):
+        line_spans = []
+        line = 0
+        for start, end in text_spans:
+            while line < len(offsets) and offsets[line][-1] < start:
+                line += 1
+            if line == len(offsets):
+                break
+            end_line = line
+            while end_line + 1 < len(offsets) and offsets[end_line + 1][0] <= end:
+                end_line += 1
+            line_spans.append((
+                line,
+                bisect.bisect_left(offsets[line], start),
+                end_line,
+                bisect.bisect_right(offsets[end_line], end) - 1
+            ))
+            line = end_line
+        return line_spans
+
+    def _get_justified(self, lines):
+        if self.justify_full:
+            return [self.line_breaker.justify(line) for line in lines]
+        return lines
+
+    # :::: OTHER ::::::::::::::::::: #
+
+    def _wrap(self, text):
+        if self.book.has_dict() and self.hyphenation:
+            try:
+                return wrap2(text, self.page_columns, use_hyphenator=self.book.get_lang_dict())
+            except:
+                return self.line_breaker.wrap(text)
+        return self.line_breaker.wrap(text)
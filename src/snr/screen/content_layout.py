@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+import bisect
+import threading
+from .chapter_lines import ChapterLines
+
+class ContentLayout:
+    def __init__(
+        self,
+        book,
+        chapter,
+        page_columns,
+        page_lines,
+        hyphenation,
+        justify_full,
+        lines=None
+    ):
+        self.book = book
+        self.chapter = chapter
+        self.page_columns = page_columns
+        self.page_lines = page_lines
+        self.hyphenation = hyphenation
+        self.justify_full = justify_full
+        self.lock = threading.RLock()
+        self._set_lines(lines)
+        self._set_pages()
+
+    # :::: SETTERS ::::::::::::::::: #
+
+    def _set_pages(self):
+        self.pages = []
+        self.runs = []
+        self.speech_map = {}
+        self.info_map = {}
+        self.line_runs = {}
+        self.paragraphs = []
+        self.first_pages = []
+        self.last_pages = []
+        self.is_complete = False
+        self.paginator = self._get_pages()
+
+    def _set_lines(self, lines):
+        if lines is None:
+            lines = ChapterLines(
+                self.book,
+                self.chapter,
+                self.page_columns,
+                self.hyphenation,
+                self.justify_full
+            )
+        self.lines = lines
+
+    def _set_next_page(self):
+        page = next(self.paginator, None)
+        if page is None:
+            self.is_complete = True
+            return
+        page, runs = page
+        self._set_paragraph_pages(len(self.pages), page)
+        self.runs.append(runs)
+        self.pages.append(page)
+
+    def _set_paragraph_pages(self, index, page):
+        for line in page:
+            if len(self.paragraphs) != 0 and self.paragraphs[-1] == line[0]:
+                self.last_pages[-1] = index
+            else:
+                self.first_pages.append(index)
+                self.last_pages.append(index)
+                self.paragraphs.append(line[0])
+
+    def _set_pages_until(self, page):
+        while (page < 0 or len(self.pages) <= page) and not self.is_complete:
+            with self.lock:
+                if (page < 0 or len(self.pages) <= page) and not self.is_complete:
+                    self._set_next_page()
+
+    def _set_pages_past_index(self, index):
+        while not self.is_complete and (len(self.pages) == 0 or self.pages[-1][-1][0] <= index):
+            with self.lock:
+                if not self.is_complete and (len(self.pages) == 0 or self.pages[-1][-1][0] <= index):
+                    self._set_next_page()
+
+    # :::: GETTERS ::::::::::::::::: #
+
+    def _get_pages(self):
+        on_page = []
+        runs = []
+        if self.book.has_text(self.chapter):
+            for index in range(self.lines.get_number_of_paragraphs()):
+                lines_of_text = self.lines.get_lines(index)
+                position = 0
+                while position < len(lines_of_text):
+                    if len(lines_of_text) - position + len(on_page) + 1 <= self.page_lines:
+                        runs.append((index, position, len(on_page), len(lines_of_text) - position))
+                        on_page.extend([index, text] for text in lines_of_text[position:])
+                        on_page.append([index, ''])
+                        position = len(lines_of_text)
+                    else:
+                        end = position + self.page_lines - len(on_page)
+                        runs.append((index, position, len(on_page), end - position))
+                        on_page.extend([index, text] for text in lines_of_text[position:end])
+                        position = end
+                        yield on_page, runs
+                        on_page = []
+                        runs = []
+            if len(on_page) != 0:
+                yield on_page, runs
+        else:
+            title_lines = self.lines.get_title_lines()
+            runs.append((None, 0, 0, len(title_lines) + 1))
+            on_page.extend([0, text] for text in title_lines)
+            on_page.append([1, '* * *'])
+            yield on_page, runs
+
+    def _get_page_map(self, page, kind):
+        coordinates_map = {
+            'opening_coordinates': [],
+            'closing_coordinates': []
+        }
+        for index, first_line, first_y, number_of_lines in self.runs[page]:
+            last_line = first_line + number_of_lines - 1
+            for start_line, start_x, end_line, end_x in self.lines.get_spans(index, kind):
+                if end_line < first_line or start_line > last_line:
+                    continue
+                if start_line >= first_line:
+                    coordinates_map['opening_coordinates'].append([first_y + start_line - first_line, start_x])
+                else:
+                    coordinates_map['opening_coordinates'].append([first_y, 0])
+                if end_line <= last_line:
+                    coordinates_map['closing_coordinates'].append([first_y + end_line - first_line, end_x])
+                else:
+                    last_y = first_y + number_of_lines - 1
+                    coordinates_map['closing_coordinates'].append([last_y, len(self.pages[page][last_y][1]) - 1])
+        return coordinates_map
+
+    def _get_line_runs(self, page, skip_index):
+        speech_map = self.get_speech_map(page)
+        info_map = self.get_info_map(page)
+        openings = {}
+        closings = {}
+        for kind, coordinates_map in (('info', info_map), ('speech', speech_map)):
+            for y, x in coordinates_map['opening_coordinates']:
+                openings.setdefault(y, {})[x] = kind
+            for y, x in coordinates_map['closing_coordinates']:
+                closings.setdefault((y, kind), set()).add(x)
+        line_runs = []
+        kind = None
+        for y, line in enumerate(self.pages[page]):
+            text = line[1]
+            if line[0] == skip_index:
+                line_runs.append([(0, text, 'select')] if len(text) != 0 else [])
+                continue
+            runs = []
+            x = 0
+            while x < len(text):
+                if kind is None:
+                    line_openings = [opening for opening in openings.get(y, ()) \
+                        if x <= opening < len(text)]
+                    if len(line_openings) == 0:
+                        runs.append((x, text[x:], 'normal'))
+                        break
+                    start = min(line_openings)
+                    if start > x:
+                        runs.append((x, text[x:start], 'normal'))
+                    kind = openings[y][start]
+                    x = start
+                    start += 1
+                else:
+                    start = x
+                line_closings = [closing for closing in closings.get((y, kind), ()) \
+                    if start <= closing < len(text)]
+                if len(line_closings) == 0:
+                    runs.append((x, text[x:], kind))
+                    break
+                end = min(line_closings) + 1
+                runs.append((x, text[x:end], kind))
+                kind = None
+                x = end
+            line_runs.append(runs)
+        return line_runs
+
+    def get_page(self, page):
+        self._set_pages_until(page)
+        return self.pages[page]
+
+    def has_page(self, page):
+        self._set_pages_until(page)
+        return page < len(self.pages)
+
+    def get_number_of_pages(self):
+        self._set_pages_until(-1)
+        return len(self.pages)
+
+    def count_pages(self):
+        if self.is_complete:
+            return len(self.pages)
+        return sum(1 for _ in self._get_pages())
+
+    def get_number_of_ready_pages(self):
+        return len(self.pages)
+
+    def _get_paragraph_pages(self, index):
+        self._set_pages_past_index(index)
+        position = bisect.bisect_left(self.paragraphs, index)
+        if position < len(self.paragraphs) and self.paragraphs[position] == index:
+            return self.first_pages[position], self.last_pages[position]
+        return None
+
+    def get_page_by_index(self, index):
+        paragraph_pages = self._get_paragraph_pages(index)
+        if paragraph_pages is None:
+            return 0
+        return paragraph_pages[0]
+
+    def get_pages_by_index(self, index):
+        paragraph_pages = self._get_paragraph_pages(index)
+        if paragraph_pages is None:
+            return []
+        return list(range(paragraph_pages[0], paragraph_pages[1] + 1))
+
+    def is_index_on_page(self, index, page):
+        paragraph_pages = self._get_paragraph_pages(index)
+        if paragraph_pages is None:
+            return False
+        return paragraph_pages[0] <= page <= paragraph_pages[1]
+
+    def get_speech_map(self, page):
+        self._set_pages_until(page)
+        if page not in self.speech_map:
+            self.speech_map[page] = self._get_page_map(page, 'speech')
+        return self.speech_map[page]
+
+    def get_info_map(self, page):
+        self._set_pages_until(page)
+        if page not in self.info_map:
+            self.info_map[page] = self._get_page_map(page, 'info')
+        return self.info_map[page]
+
+    def get_line_runs(self, page, skip_index=None):
+        self._set_pages_until(page)
+        if skip_index is not None:
+            return self._get_line_runs(page, skip_index)
+        if page not in self.line_runs:
+            self.line_runs[page] = self._get_line_runs(page, None)
+        return self.line_runs[page]
+
+    def is_paginated(self):
+        return self.is_complete
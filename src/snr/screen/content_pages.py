@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 
 import curses
-from textwrap import wrap
-from textwrap2 import wrap as wrap2
 from .pages import Pages
+from .layout_cache import LayoutCache
 
 class ContentPages(Pages):
     def __init__(
@@ -14,7 +13,8 @@ class ContentPages(Pages):
         modes,
         v_padding=2,
         h_padding=2,
-        pe_multiplier=.2
+        pe_multiplier=.2,
+        layouts=None
     ):
         super().__init__(
             screen,
@@ -25,10 +25,10 @@ class ContentPages(Pages):
             h_padding,
         )
         self.pe_multiplier = pe_multiplier
+        self.layouts = layouts
+        self.is_framed = False
         self._set_page()
-        self._set_pages()
-        self._set_speech_map()
-        self._set_info_map()
+        self._set_layout()
 
     # :::: SETTERS ::::::::::::::::: #
 
@@ -54,125 +54,42 @@ class ContentPages(Pages):
                 self.page_pos_x_right
             )
 
-    def _set_pages(self):
-        self.pages = []
-        on_page = []
-        if self.book.has_text(self.chapter):
-            content = self.book.get_chapter_text(self.chapter)
-            for index, paragraph in enumerate(content):
-                if self.book.has_dict() and self.hyphenation:
-                    try:
-                        lines_of_text = wrap2(paragraph, self.page_columns, use_hyphenator=self.book.get_lang_dict())
-                    except:
-                        lines_of_text = wrap(paragraph, self.page_columns)
-                else:
-                    lines_of_text = wrap(paragraph, self.page_columns)
-                while len(lines_of_text) > 0:
-                    if len(lines_of_text) + len(on_page) + 1 <= self.page_lines:
-                        for text in lines_of_text:
-                            if self.justify_full:
-                                on_page.append([index, self.justify_line(text)])
-                            else:
-                                on_page.append([index, text])
-                        if len(on_page) != 0:
-                            on_page.append([index, ''])
-                        lines_of_text = []
-                    else:
-                        for _ in range(len(on_page), self.page_lines):
-                            if self.justify_full:
-                                on_page.append([index, self.justify_line(lines_of_text[0])])
-                            else:
-                                on_page.append([index, lines_of_text[0]])
-                            lines_of_text.pop(0)
-                        self.pages.append(on_page)
-                        on_page = []
-            if len(on_page) != 0:
-                self.pages.append(on_page)
-        else:
-            content = self.book.get_chapter_title(self.chapter)
-            if self.book.has_dict() and self.hyphenation:
-                try:
-                    lines_of_text = wrap2(content, self.page_columns, use_hyphenator=self.book.get_lang_dict())
-                except:
-                    lines_of_text = wrap(content, self.page_columns)
-            else:
-                lines_of_text = wrap(content, self.page_columns)
-            for text in lines_of_text:
-                if self.justify_full:
-                    on_page.append([0, self.justify_line(text)])
-                else:
-                    on_page.append([0, text])
-            on_page.append([1, '* * *'])
-            self.pages.append(on_page)
-
-    def _set_speech_map(self):
-        self._speech_open = ['\'', '"', '‘', '“']
-        self._speech_close = ['\'', '"', '’', '”']
-        self._speech_after = ['\n', ' ', '.', ',',  ';', ':', '!', '?', '-', '—']
-        self._speech_after.extend(self._speech_close)
-        self.speech_map = self._get_coordinates_map(self._speech_open, self._speech_close, \
-            self._speech_after)
-
-    def _set_info_map(self):
-        self._info_open = ['<', '(', '[', '{']
-        self._info_close = ['>', ')', ']', '}']
-        self._info_after = ['\n', ' ', '.', ',',  ';', ':', '!', '?', '-', '—']
-        self._info_after.extend(self._info_close)
-        self._info_after.extend(self._speech_close)
-        self.info_map = self._get_coordinates_map(self._info_open, self._info_close, \
-            self._info_after)
+    def _set_layout(self):
+        if self.layouts is None:
+            self.layouts = LayoutCache(1, 0)
+        geometry = [
+            self.page_columns,
+            self.page_lines,
+            self.hyphenation,
+            self.justify_full
+        ]
+        self.layout = self.layouts.get_layout(self.book, self.chapter, *geometry)
+        self.layouts.prefetch(self.book, self.chapter, *geometry)
+        self.page_map = self.layouts.get_page_map(self.book, *geometry)
+
+    def set_modes(self, modes):
+        super().set_modes(modes)
+        self.is_framed = False
 
     # :::: GETTERS ::::::::::::::::: #
 
-    def _get_coordinates_map(self, opening_marks, closing_marks, closing_after):
-        coordinates_map = {}
-        previous_index = 0
-        is_opened = False
-        for index, page in enumerate(self.pages):
-            coordinates_map[index] = {
-                'opening_coordinates': [],
-                'closing_coordinates': []
-            }
-            for y, line in enumerate(page):
-                if is_opened and line[0] > previous_index:
-                    is_opened = False
-                    coordinates_map[index]['closing_coordinates'].append([y - 2, len(page[y - 2][1]) - 1])
-                if is_opened and y == 0:
-                    coordinates_map[index]['opening_coordinates'].append([y, 0])
-                for x, character in enumerate(line[1]):
-                    try:
-                        if character in opening_marks \
-                            and not is_opened \
-                            and (x == 0 or line[1][x - 1] == ' '):
-                            is_opened = True
-                            current_mark = opening_marks.index(character)
-                            coordinates_map[index]['opening_coordinates'].append([y, x])
-                        if is_opened and character == closing_marks[current_mark]:
-                            if x == len(line[1]) - 1 or line[1][x + 1] in closing_after:
-                                is_opened = False
-                                coordinates_map[index]['closing_coordinates'].append([y, x])
-                    except IndexError:
-                        pass
-                if is_opened and y == len(page) - 1:
-                    if line[1] != '':
-                        coordinates_map[index]['closing_coordinates'].append([y, len(line[1]) - 1])
-                    else:
-                        coordinates_map[index]['closing_coordinates'].append([y, len(line[1])])
-                previous_index = line[0]
-        return coordinates_map
-
     def _get_page_content(self, current_page, page, bookmarks, quickmarks, mark_change, index):
-        is_open = False
-        is_speech = False
-        is_info = False
         keys = self._get_bookmark_index_list(current_page, bookmarks)[1]
         slots = self._get_quickmark_index_list(current_page, quickmarks)[1]
         if self.highlight:
             try:
-                for y, line in enumerate(self.pages[current_page]):
+                lines = self.layout.get_page(current_page)
+                line_runs = self.layout.get_line_runs(current_page, index if mark_change else None)
+                colors = {
+                    'normal': self.normal_colors,
+                    'speech': self.speech_colors,
+                    'info': self.info_colors,
+                    'select': self.select_colors
+                }
+                for y, line in enumerate(lines):
                     if line[0] in keys:
                         try:
-                            if self.pages[current_page][y + 1][0] != line[0]:
+                            if lines[y + 1][0] != line[0]:
                                 pass
                             else:
                                 page.addch(
@@ -190,7 +107,7 @@ class ContentPages(Pages):
                             )
                     if line[0] in slots:
                         try:
-                            if self.pages[current_page][y + 1][0] != line[0]:
+                            if lines[y + 1][0] != line[0]:
                                 pass
                             else:
                                 page.addch(
@@ -206,43 +123,13 @@ class ContentPages(Pages):
                                     curses.ACS_BLOCK,
                                     self.select_colors
                                 )
-                    for x, character in enumerate(line[1]):
-                        if mark_change and line[0] == index:
-                            page.addstr(y + self.v_padding, x + self.h_padding, \
-                                character, self.select_colors)
-                        else:
-                            if not is_open:
-                                if [y, x] in self.speech_map[current_page]['opening_coordinates']:
-                                    page.addstr(y + self.v_padding, x + self.h_padding, \
-                                        character, self.speech_colors)
-                                    is_open = True
-                                    is_speech = True
-                                elif [y, x] in self.info_map[current_page]['opening_coordinates']:
-                                    page.addstr(y + self.v_padding, x + self.h_padding, \
-                                        character, self.info_colors)
-                                    is_open = True
-                                    is_info = True
-                                else:
-                                    page.addstr(y + self.v_padding, x + self.h_padding, \
-                                        character, self.normal_colors)
-                            else:
-                                if is_speech:
-                                    page.addstr(y + self.v_padding, x + self.h_padding, \
-                                        character, self.speech_colors)
-                                    if [y, x] in self.speech_map[current_page]['closing_coordinates']:
-                                        is_open = False
-                                        is_speech = False
-                                elif is_info:
-                                    page.addstr(y + self.v_padding, x + self.h_padding, \
-                                        character, self.info_colors)
-                                    if [y, x] in self.info_map[current_page]['closing_coordinates']:
-                                        is_open = False
-                                        is_info = False
+                    for x, text, kind in line_runs[y]:
+                        page.addstr(y + self.v_padding, x + self.h_padding, text, colors[kind])
             except IndexError:
                 pass
         else:
             try:
-                for y, line in enumerate(self.pages[current_page]):
+                for y, line in enumerate(self.layout.get_page(current_page)):
                     if mark_change and line[0] == index:
                         page.addstr(y + self.v_padding, self.h_padding, \
                             line[1], self.select_colors)
@@ -257,7 +144,7 @@ class ContentPages(Pages):
         index_list = []
         for mark in quickmarks.get_slots():
             if quickmarks.get_chapter(mark) == self.chapter \
-                and current_page in self.get_pages_by_index(quickmarks.get_index(mark)):
+                and self.layout.is_index_on_page(quickmarks.get_index(mark), current_page):
                 slots.append(str(mark))
                 index_list.append(quickmarks.get_index(mark))
         return slots, index_list
@@ -268,7 +155,7 @@ class ContentPages(Pages):
         bookmarks = bookmarks.get_bookmarks()
         for bookmark in bookmarks.keys():
             if self.chapter == bookmarks[bookmark]['chapter'] \
-                and current_page in self.get_pages_by_index(bookmarks[bookmark]['index']):
+                and self.layout.is_index_on_page(bookmarks[bookmark]['index'], current_page):
                 keys.append(bookmark)
                 index_list.append(bookmarks[bookmark]['index'])
         return keys, index_list
@@ -310,29 +197,41 @@ class ContentPages(Pages):
                     mark_tag += str(int(key) + 1) + ','
             return mark_tag
 
+    def _get_page_number(self, current_page):
+        if self.layout.is_paginated():
+            number_of_pages = str(self.layout.get_number_of_pages())
+        else:
+            number_of_pages = str(self.layout.get_number_of_ready_pages()) + '+'
+        return '[' + str(current_page) + '/' + number_of_pages + ']'
+
+    def _get_progress_tag(self, current_page, goto):
+        if goto is not None:
+            return '[:' + goto + ']'
+        if not self.page_map.is_ready():
+            return ''
+        page, number_of_pages, percent = self.page_map.get_progress(self.chapter, current_page)
+        return '[page ' + str(page) + '/' + str(number_of_pages) + ' (' + str(percent) + '%)]'
+
     def get_number_of_pages(self):
-        return len(self.pages)
+        return self.layout.get_number_of_pages()
+
+    def get_page_map(self):
+        return self.page_map
+
+    def has_page(self, current_page):
+        return self.layout.has_page(current_page)
 
     def get_page_by_index(self, index):
-        for current_page, page in enumerate(self.pages):
-            for line in page:
-                if index == line[0]:
-                    return current_page
-        return 0
+        return self.layout.get_page_by_index(index)
 
     def get_pages_by_index(self, index):
-        pages = []
-        for current_page, page in enumerate(self.pages):
-            for line in page:
-                if index == line[0]:
-                    pages.append(current_page)
-        return pages
+        return self.layout.get_pages_by_index(index)
 
     def get_current_page_index(self, current_page):
-        return self.pages[current_page][0][0]
+        return self.layout.get_page(current_page)[0][0]
 
     def get_current_page_last_index(self, current_page):
-        return self.pages[current_page][-1][0]
+        return self.layout.get_page(current_page)[-1][0]
 
     # :::: OTHER ::::::::::::::::::: #
 
@@ -420,6 +319,10 @@ class ContentPages(Pages):
                 self.info_colors
             )
 
+    def _print_progress(self, page, pos_x, max_x, progress_tag):
+        if pos_x + len(progress_tag) < max_x:
+            page.addstr(self.page_max_y - 1, pos_x, progress_tag, self.info_colors)
+
     def _print_content(self, current_page, bookmarks, quickmarks, bookmark_change, quickmark_change, index):
         mark_change = True if bookmark_change or quickmark_change else False
         if not self.double_page:
@@ -428,21 +331,28 @@ class ContentPages(Pages):
             self._get_page_content(current_page, self.page_left, bookmarks, quickmarks, mark_change, index)
             self._get_page_content(current_page + 1, self.page_right, bookmarks, quickmarks, mark_change, index)
 
-    def _print_footer(self, current_page, bookmarks, quickmarks, bookmark_change, quickmark_change):
+    def _print_footer(self, current_page, bookmarks, quickmarks, bookmark_change, quickmark_change, goto):
+        progress_tag = self._get_progress_tag(current_page, goto)
         if not self.double_page:
             mark_tag = self._get_quickmark_tag(current_page, quickmarks, quickmark_change, '[Q:+]') \
                 + self._get_bookmark_tag(current_page, bookmarks, bookmark_change, '[B:+]')
             current_page += 1
-            page_number = '[' + str(current_page) + '/' + str(self.get_number_of_pages()) + ']'
+            page_number = self._get_page_number(current_page)
             pos_y = self.page_max_y - 1
             pos_x = self.page_max_x - self.static_padding
             self.page.addstr(pos_y, pos_x - len(mark_tag), mark_tag, self.info_colors)
             self.page.addstr(pos_y, pos_x - len(page_number) - len(mark_tag), page_number, self.info_colors)
+            self._print_progress(
+                self.page,
+                self.static_padding,
+                pos_x - len(page_number) - len(mark_tag),
+                progress_tag
+            )
         else:
             mark_tag = self._get_quickmark_tag(current_page, quickmarks, quickmark_change, '[Q:+]') \
                 + self._get_bookmark_tag(current_page, bookmarks, bookmark_change, '[B:+]')
             current_page += 1
-            page_number = '[' + str(current_page) + '/' + str(self.get_number_of_pages()) + ']'
+            page_number = self._get_page_number(current_page)
             pos_y = self.page_max_y - 1
             pos_x = self.page_max_x - self.static_padding - len(mark_tag)
             self.page_left.addstr(
@@ -452,11 +362,17 @@ class ContentPages(Pages):
                 self.info_colors
             )
             self.page_left.addstr(pos_y, self.static_padding, page_number, self.info_colors)
-            if current_page + 1 <= self.get_number_of_pages():
+            self._print_progress(
+                self.page_left,
+                self.static_padding + len(page_number) + 1,
+                pos_x,
+                progress_tag
+            )
+            if self.has_page(current_page):
                 mark_tag = self._get_bookmark_tag(current_page, bookmarks, bookmark_change, '[B:+]') \
                     + self._get_quickmark_tag(current_page, quickmarks, quickmark_change, '[Q:+]')
                 current_page += 1
-                page_number = '[' + str(current_page) + '/' + str(self.get_number_of_pages()) + ']'
+                page_number = self._get_page_number(current_page)
                 pos_x = self.page_max_x - self.static_padding - len(page_number)
                 self.page_right.addstr(
                     pos_y,
@@ -482,6 +398,17 @@ class ContentPages(Pages):
                 self.perception_colors
             )
 
+    def _print_frame(self, page):
+        page.erase()
+        page.bkgd(' ', self.normal_colors)
+        page.box()
+
+    def _clear_page(self, page):
+        blank_line = ' ' * (self.page_max_x - 2)
+        for y in range(self.page_lines):
+            page.addstr(y + self.v_padding, 1, blank_line, self.normal_colors)
+        page.hline(self.page_max_y - 1, 1, curses.ACS_HLINE, self.page_max_x - 2)
+
     def print_page(
         self,
         current_page,
@@ -489,16 +416,19 @@ class ContentPages(Pages):
         quickmarks,
         bookmark_change=False,
         quickmark_change=False,
-        index=None
+        index=None,
+        goto=None
     ):
         if index is None:
             index = self.get_current_page_index(current_page)
         if not self.double_page:
-            self.page.erase()
-            self.page.bkgd(' ', self.normal_colors)
-            self.page.box()
+            if not self.is_framed:
+                self._print_frame(self.page)
+            else:
+                self._clear_page(self.page)
             try:
-                self._print_header()
+                if not self.is_framed:
+                    self._print_header()
                 self._print_content(
                     current_page,
                     bookmarks,
@@ -512,22 +442,24 @@ class ContentPages(Pages):
                     bookmarks,
                     quickmarks,
                     bookmark_change,
-                    quickmark_change
+                    quickmark_change,
+                    goto
                 )
                 if self.speed_mode:
                     self.print_perception_expander(self.page)
             except:
                 pass
-            self.page.refresh()
+            self.page.noutrefresh()
         else:
-            self.page_left.erase()
-            self.page_right.erase()
-            self.page_left.bkgd(' ', self.normal_colors)
-            self.page_right.bkgd(' ', self.normal_colors)
-            self.page_left.box()
-            self.page_right.box()
+            if not self.is_framed:
+                self._print_frame(self.page_left)
+                self._print_frame(self.page_right)
+            else:
+                self._clear_page(self.page_left)
+                self._clear_page(self.page_right)
             try:
-                self._print_header()
+                if not self.is_framed:
+                    self._print_header()
                 self._print_content(
                     current_page,
                     bookmarks,
@@ -541,12 +473,15 @@ class ContentPages(Pages):
                     bookmarks,
                     quickmarks,
                     bookmark_change,
-                    quickmark_change
+                    quickmark_change,
+                    goto
                 )
                 if self.speed_mode:
                     self.print_perception_expander(self.page_left)
                     self.print_perception_expander(self.page_right)
             except:
                 pass
-            self.page_left.refresh()
-            self.page_right.refresh()
+            self.page_left.noutrefresh()
+            self.page_right.noutrefresh()
+        self.is_framed = True
+        curses.doupdate()
@@ -53,6 +53,7 @@ class HelpPages(Pages):
                 'Previous chapter': 'h, P',
                 'Beginning of chapter': 'g, 0',
                 'End of chapter': 'G, $',
+                'Go to page or percent': ':',
                 'Select': 'o, Enter',
                 'Escape': 'Esc, BackSpace',
                 'Refresh': 'R, F5',
@@ -75,7 +76,14 @@ class HelpPages(Pages):
                 'OPEN MODULES': '',
                 'Table of contents': 't, Tab',
                 'Bookmark page': 'b',
-                'Help page': '?, F1'
+                'Help page': '?, F1',
+                'TABLE OF CONTENTS': '',
+                'Filter chapters': '/',
+                'Go to chapter number': '[0-9]',
+                'Next screen': 'l, N',
+                'Previous screen': 'h, P',
+                'First chapter': 'g, 0',
+                'Last chapter': 'G, $'
             },
             'MARKING': {
                 'QUICKMARKS': '',
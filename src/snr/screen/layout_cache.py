@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import threading
+from collections import deque
+import snr.utilities as Utilities
+from .chapter_lines import ChapterLines
+from .content_layout import ContentLayout
+from .page_map import PageMap
+
+class LayoutCache:
+    def __init__(self, max_size=16, prefetch_range=1):
+        self.layouts = Utilities.LruCache(max_size)
+        self.lines = Utilities.LruCache(max_size)
+        self.page_maps = Utilities.LruCache(4)
+        self.page_map = None
+        self.prefetch_range = prefetch_range
+        self.building = {}
+        self.requests = deque()
+        self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
+        self.worker = None
+
+    # :::: SETTERS ::::::::::::::::: #
+
+    def _set_worker(self):
+        self.worker = threading.Thread(target=self._prefetch_loop, daemon=True)
+        self.worker.start()
+
+    # :::: GETTERS ::::::::::::::::: #
+
+    def _get_prefetch_chapters(self, book, chapter):
+        chapters = [chapter]
+        for distance in range(1, self.prefetch_range + 1):
+            for neighbour in [chapter + distance, chapter - distance]:
+                if 0 <= neighbour < book.get_number_of_chapters():
+                    chapters.append(neighbour)
+        return chapters
+
+    def get_layout(self, book, chapter, page_columns, page_lines, hyphenation, justify_full):
+        key = (chapter, page_columns, page_lines, hyphenation, justify_full)
+        with self.lock:
+            layout = self.layouts.get(key)
+            if layout is not None:
+                return layout
+            building = self.building.get(key)
+            if building is None:
+                self.building[key] = threading.Event()
+        if building is not None:
+            building.wait()
+            return self.get_layout(book, *key)
+        try:
+            layout = ContentLayout(
+                book,
+                *key,
+                self.get_lines(book, chapter, page_columns, hyphenation, justify_full)
+            )
+            with self.lock:
+                self.layouts.set(key, layout)
+        finally:
+            with self.lock:
+                self.building.pop(key).set()
+        return layout
+
+    def get_lines(self, book, chapter, page_columns, hyphenation, justify_full):
+        key = (chapter, page_columns, hyphenation, justify_full)
+        lines = self.lines.get(key)
+        if lines is None:
+            lines = ChapterLines(book, *key)
+            self.lines.set(key, lines)
+        return lines
+
+    def get_cached_layout(self, chapter, page_columns, page_lines, hyphenation, justify_full):
+        with self.lock:
+            return self.layouts.get((chapter, page_columns, page_lines, hyphenation, justify_full))
+
+    def get_page_map(self, book, page_columns, page_lines, hyphenation, justify_full):
+        key = (page_columns, page_lines, hyphenation, justify_full)
+        with self.lock:
+            page_map = self.page_maps.get(key)
+            if page_map is None:
+                page_map = PageMap(book, *key, self)
+                self.page_maps.set(key, page_map)
+            if self.page_map is not page_map:
+                if self.page_map is not None:
+                    self.page_map.cancel()
+                page_map.release()
+            self.page_map = page_map
+        return page_map
+
+    # :::: OTHER ::::::::::::::::::: #
+
+    def prefetch(self, book, chapter, page_columns, page_lines, hyphenation, justify_full):
+        if self.prefetch_range < 1:
+            return
+        with self.condition:
+            self.requests.clear()
+            for neighbour in self._get_prefetch_chapters(book, chapter):
+                key = (neighbour, page_columns, page_lines, hyphenation, justify_full)
+                layout = self.layouts.get(key)
+                if layout is None or not layout.is_paginated():
+                    self.requests.append((book, key))
+            if self.worker is None:
+                self._set_worker()
+            self.condition.notify()
+
+    def _prefetch_loop(self):
+        while True:
+            with self.condition:
+                while len(self.requests) == 0:
+                    self.condition.wait()
+                book, key = self.requests.popleft()
+            try:
+                self.get_layout(book, *key).get_number_of_pages()
+            except Exception:
+                pass
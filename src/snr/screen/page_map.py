@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+import bisect
+import threading
+from .content_layout import ContentLayout
+
+class PageMap:
+    def __init__(
+        self,
+        book,
+        page_columns,
+        page_lines,
+        hyphenation,
+        justify_full,
+        layouts=None
+    ):
+        self.book = book
+        self.geometry = (page_columns, page_lines, hyphenation, justify_full)
+        self.layouts = layouts
+        self.background = not book.is_lazy_parsing()
+        self.counts = []
+        self.offsets = [0]
+        self.failed = False
+        self.worker = None
+        self.lock = threading.Lock()
+        self.release()
+
+    # :::: SETTERS ::::::::::::::::: #
+
+    def _set_worker(self):
+        if self.worker is None and not self._is_satisfied():
+            self.worker = threading.Thread(target=self._set_counts, daemon=True)
+            self.worker.start()
+
+    def _set_counts(self):
+        while True:
+            with self.lock:
+                if self._is_satisfied():
+                    self.worker = None
+                    return
+                chapter = len(self.counts)
+            try:
+                count = self._get_layout(chapter).count_pages()
+            except Exception:
+                count = None
+            with self.lock:
+                if count is None:
+                    self.failed = True
+                else:
+                    self.offsets.append(self.offsets[-1] + count)
+                    self.counts.append(count)
+
+    # :::: GETTERS ::::::::::::::::: #
+
+    def _get_layout(self, chapter):
+        if self.layouts is not None:
+            layout = self.layouts.get_cached_layout(chapter, *self.geometry)
+            if layout is not None:
+                return layout
+        return ContentLayout(self.book, chapter, *self.geometry)
+
+    def _is_satisfied(self):
+        if self.is_finished():
+            return True
+        return self.needed is not None and self.offsets[-1] >= self.needed
+
+    def is_finished(self):
+        return self.failed or len(self.counts) == self.book.get_number_of_chapters()
+
+    def is_ready(self):
+        return self.is_finished() and not self.failed and self.offsets[-1] > 0
+
+    def is_counted(self, page=None):
+        if page is None or self.is_finished():
+            return self.is_finished()
+        return self.offsets[-1] > page
+
+    def has_position(self, page=None):
+        if page is None or self.is_ready():
+            return self.is_ready()
+        return self.offsets[-1] > page
+
+    def get_number_of_pages(self):
+        return self.offsets[-1]
+
+    def get_page(self, chapter, page):
+        return self.offsets[chapter] + page
+
+    def get_position(self, page):
+        page = max(0, min(page, self.get_number_of_pages() - 1))
+        chapter = bisect.bisect_right(self.offsets, page) - 1
+        return chapter, page - self.offsets[chapter]
+
+    def get_percent_position(self, percent):
+        page = int(self.get_number_of_pages() * min(percent, 100) / 100)
+        return self.get_position(page)
+
+    def get_progress(self, chapter, page):
+        page = self.get_page(chapter, page) + 1
+        number_of_pages = self.get_number_of_pages()
+        percent = int(page * 100 / number_of_pages)
+        return page, number_of_pages, percent
+
+    # :::: OTHER ::::::::::::::::::: #
+
+    def request(self, page=None):
+        with self.lock:
+            if page is None:
+                self.needed = None
+            elif self.needed is not None:
+                self.needed = max(self.needed, page + 1)
+            self._set_worker()
+
+    def release(self):
+        with self.lock:
+            self.needed = None if self.background else 0
+            self._set_worker()
+
+    def cancel(self):
+        with self.lock:
+            self.needed = 0
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import curses
-from textwrap import wrap
 
 class Pages:
     def __init__(
@@ -23,6 +22,7 @@ class Pages:
         self.justify_full = modes['justify_full']
         self.hyphenation = modes['hyphenation']
         self.screen_max_y, self.screen_max_x = screen.getmaxyx()
+        self.geometry = self._get_geometry(screen, modes, v_padding, h_padding)
         self._set_page_max_y()
         self._set_page_max_x()
         self.static_padding = 3
@@ -124,11 +124,23 @@ class Pages:
             self.select_colors = curses.color_pair(4)
             self.perception_colors = curses.color_pair(5)
 
+    def set_modes(self, modes):
+        self.dark_mode = modes['dark_mode']
+        self.speed_mode = modes['speed_mode']
+        self.highlight = modes['highlight']
+        self._set_colors()
+
     # :::: GETTERS ::::::::::::::::: #
 
+    def _get_geometry(self, screen, modes, v_padding, h_padding):
+        return [screen.getmaxyx(), modes['double_page'], v_padding, h_padding]
+
     def get_double_page(self):
         return self.double_page
 
+    def is_outdated(self, screen, modes, v_padding, h_padding):
+        return self.geometry != self._get_geometry(screen, modes, v_padding, h_padding)
+
     # :::: OTHER ::::::::::::::::::: #
 
     def shorten_title(self, title):
@@ -136,23 +148,3 @@ class Pages:
             return title[:self.page_max_x - self.static_padding * 2 - 4] + '...]'
         else:
             return title
-
-    def justify_line(self, line):
-        just_line = []
-        words = line.split(" ")
-        words_len = sum(len(word) for word in words)
-        if words_len < int(self.page_columns / 1.6):
-            return line
-        spaces_number = len(words) - 1
-        spaces = [1 for _ in range(spaces_number)]
-        index = 0
-        if spaces:
-            while words_len + spaces_number < self.page_columns:
-                spaces[len(spaces) - index - 1] += 1
-                spaces_number += 1
-                index = (index + 1) % len(spaces)
-        for index, word in enumerate(words):
-            just_line.append(word)
-            if index < len(spaces):
-                just_line.append(' ' * spaces[index])
-        return ''.join(just_line)
@@ -3,6 +3,7 @@
 import curses
 from textwrap import wrap
 from .pages import Pages
+import snr.utilities as Utilities
 
 class TocPages(Pages):
     def __init__(
@@ -23,7 +24,9 @@ class TocPages(Pages):
             h_padding,
         )
         self._set_page()
-        self._set_pages()
+        self._set_toc_lines()
+        self._set_entries()
+        self._set_matches()
 
     # :::: SETTERS ::::::::::::::::: #
 
@@ -43,46 +46,106 @@ class TocPages(Pages):
                 self.page_pos_x_right
             )
 
-    def _set_pages(self):
-        toc = self.book.get_toc()
-        self.pages = []
-        page = []
-        lines = 0
-        for key in toc.keys():
-            chapter = wrap(
-                toc[key],
-                self.page_max_x - self.id_margin - self.static_padding
-            )
-            if len(chapter) + lines < self.page_max_y - self.static_padding * 2:
-                page.append({
-                    'id': key,
-                    'name': chapter
-                })
-                lines += len(chapter)
-                chapter = []
-            else:
-                self.pages.append(page)
-                page = []
-                lines = 0
-                if len(chapter) != 0:
-                    page.append({
-                        'id': key,
-                        'name': chapter
-                    })
-                    lines += len(chapter)
-        if len(page) != 0:
-            self.pages.append(page)
+    def _set_toc_lines(self):
+        self.toc_lines = self.page_max_y - self.static_padding * 2
+        self.toc_columns = self.page_max_x - self.id_margin - self.static_padding
+
+    def _set_entries(self):
+        self.toc = self.book.get_toc()
+        self.ids = list(self.toc.keys())
+        self.names = Utilities.LruCache(1024)
+
+    def _set_matches(self, query='', positions=None):
+        self.query = query
+        self.matches = self.book.get_toc_matches(query, positions)
+        self.rows = None
+        self.position = 0
+        self.top = 0
+
+    def _set_top(self):
+        if self.position < self.top:
+            self.top = self.position
+            return
+        top = self.position
+        lines = len(self._get_name(top))
+        while top > self.top and lines + len(self._get_name(top - 1)) <= self.toc_lines:
+            top -= 1
+            lines += len(self._get_name(top))
+        self.top = top
+
+    def set_query(self, query):
+        if self.query != '' and query.startswith(self.query):
+            self._set_matches(query, self.matches)
+        else:
+            self._set_matches(query)
+
+    def reset(self):
+        self._set_matches()
 
     # :::: GETTERS ::::::::::::::::: #
 
-    def get_number_of_pages(self):
-        return len(self.pages)
+    def _get_name(self, match):
+        position = self.matches[match]
+        name = self.names.get(position)
+        if name is None:
+            name = wrap(self.toc[self.ids[position]] or '', self.toc_columns) or ['']
+            self.names.set(position, name)
+        return name
+
+    def _get_row(self, position):
+        if self.rows is None:
+            self.rows = {position: row for row, position in enumerate(self.matches)}
+        return self.rows.get(position)
+
+    def _get_window(self):
+        window = []
+        lines = 0
+        for match in range(self.top, len(self.matches)):
+            name = self._get_name(match)
+            if len(window) != 0 and lines + len(name) > self.toc_lines:
+                break
+            window.append(match)
+            lines += len(name)
+        return window
+
+    def get_query(self):
+        return self.query
 
-    def get_number_of_positions(self, current_page):
-        return len(self.pages[current_page])
+    def get_position_id(self):
+        return self.ids[self.matches[self.position]]
 
-    def get_position_id(self, current_page, current_pos):
-        return self.pages[current_page][current_pos]['id']
+    def has_matches(self):
+        return len(self.matches) != 0
+
+    # :::: OTHER ::::::::::::::::::: #
+
+    def move(self, step):
+        if self.has_matches():
+            self.position = (self.position + step) % len(self.matches)
+            self._set_top()
+
+    def move_page(self, step):
+        if self.has_matches():
+            number_of_positions = len(self._get_window())
+            self.position = self.position + step * number_of_positions
+            self.position = min(max(self.position, 0), len(self.matches) - 1)
+            self._set_top()
+
+    def move_home(self):
+        if self.has_matches():
+            self.position = 0
+            self._set_top()
+
+    def move_end(self):
+        if self.has_matches():
+            self.position = len(self.matches) - 1
+            self._set_top()
+
+    def move_to_id(self, chapter_id):
+        row = self._get_row(chapter_id - 1)
+        if row is not None:
+            self.position = row
+            self._set_top()
 
     # :::: PRINTERS :::::::::::::::: #
 
@@ -95,65 +158,75 @@ class TocPages(Pages):
             self.info_colors
         )
 
-    def _print_content(self, current_page, pointer_pos):
+    def _print_content(self):
         pos_y = self.static_padding
-        for y, chapter in enumerate(self.pages[current_page]):
-            if pointer_pos == y:
+        for match in self._get_window():
+            chapter_id = self.ids[self.matches[match]]
+            if match == self.position:
                 self.page.addstr(
                     pos_y,
                     self.static_padding,
                     self.pointer,
                     self.select_colors
                 )
-                chapter_index = ' ' * abs((len(str(chapter['id'])) - 3) * -1) \
-                    + str(chapter['id']) + self.index_suffix
+                chapter_index = ' ' * abs((len(str(chapter_id)) - 3) * -1) \
+                    + str(chapter_id) + self.index_suffix
                 self.page.addstr(
                     pos_y,
                     self.static_padding + self.pointer_margin,
                     chapter_index,
                     self.select_colors
                 )
-                for line in chapter['name']:
-                    self.page.addstr(
-                        pos_y,
-                        self.id_margin,
-                        line,
-                        self.select_colors
-                    )
-                    pos_y += 1
+                name_colors = self.select_colors
             else:
-                chapter_index = ' ' * abs((len(str(chapter['id'])) - 3) * -1) \
-                    + str(chapter['id']) + ':'
+                chapter_index = ' ' * abs((len(str(chapter_id)) - 3) * -1) \
+                    + str(chapter_id) + ':'
                 self.page.addstr(
                     pos_y,
                     self.static_padding + self.pointer_margin,
                     chapter_index,
                     self.info_colors
                 )
-                for line in chapter['name']:
-                    self.page.addstr(
-                        pos_y,
-                        self.id_margin,
-                        line,
-                        self.normal_colors
-                    )
-                    pos_y += 1
-
-    def _print_footer(self, current_page):
-        current_page += 1
-        page_number = '[' + str(current_page) + '/' + str(self.get_number_of_pages()) + ']'
+                name_colors = self.normal_colors
+            for line in self._get_name(match):
+                if pos_y >= self.static_padding + self.toc_lines:
+                    return
+                self.page.addstr(
+                    pos_y,
+                    self.id_margin,
+                    line,
+                    name_colors
+                )
+                pos_y += 1
+
+    def _print_footer(self, is_filter, number):
+        if self.has_matches():
+            position_number = '[' + str(self.position + 1) + '/' + str(len(self.matches)) + ']'
+        else:
+            position_number = '[0/0]'
         pos_y = self.page_max_y - 1
-        pos_x = self.page_max_x - len(page_number) - self.static_padding
-        self.page.addstr(pos_y, pos_x, page_number, self.info_colors)
+        pos_x = self.page_max_x - len(position_number) - self.static_padding
+        self.page.addstr(pos_y, pos_x, position_number, self.info_colors)
+        if number != '':
+            prompt = '[:' + number + ']'
+        elif is_filter or self.query != '':
+            prompt = '[/' + self.query + ']'
+        else:
+            return
+        max_length = pos_x - self.static_padding - 1
+        if len(prompt) > max_length:
+            prompt = '[...' + prompt[len(prompt) - max_length + 4:]
+        if max_length > 4:
+            self.page.addstr(pos_y, self.static_padding, prompt, self.info_colors)
 
-    def print_page(self, current_page, pointer_pos):
+    def print_page(self, is_filter=False, number=''):
         self.page.erase()
         self.page.bkgd(' ', self.info_colors)
         self.page.box()
         try:
             self._print_header()
-            self._print_content(current_page, pointer_pos)
-            self._print_footer(current_page)
+            self._print_content()
+            self._print_footer(is_filter, number)
         except:
             pass
         self.page.refresh()
@@ -22,6 +22,10 @@ def snr(state, fileinput, args, default):
         justify_full = args.justify_full or config.get_justify_full()
         hyphenation = args.hyphenation or config.get_hyphenation()
         dict_download = args.dict_download or config.get_dict_download()
+        lazy_parsing = args.lazy_parsing or config.get_lazy_parsing()
+        lxml_parser = args.lxml_parser or config.get_lxml_parser()
+        parser_workers = args.parser_workers or config.get_parser_workers()
+        max_fps = args.max_fps or config.get_max_fps()
         h_padding = config.get_horizontal_padding()
         v_padding = config.get_vertical_padding()
         pe_line = config.get_pe_multiplier()
@@ -46,7 +50,22 @@ def snr(state, fileinput, args, default):
     toc_file = reader.get_toc_file()
     content_file = reader.get_content_file()
     path = reader.get_directory_path(toc_file)
-    book = Parser.BookContent(path, toc_file, content_file, dict_download, args.lang, args.verbose)
+    cache = Reader.BookCacheReader(args.verbose)
+    hyphenation_cache = Reader.HyphenationCacheReader(args.verbose)
+    book = Parser.BookContent(
+        reader,
+        path,
+        toc_file,
+        content_file,
+        dict_download,
+        args.lang,
+        args.verbose,
+        cache,
+        lazy_parsing,
+        lxml_parser,
+        parser_workers,
+        hyphenation_cache
+    )
     book_title = book.get_document_title()
     book_language = book.get_document_language()
     is_dict_installed = book.is_dict_installed()
@@ -70,7 +89,19 @@ def snr(state, fileinput, args, default):
 
     escape = False
     screen_update = True
+    style_update = False
     content_update = True
+    layouts = Screen.LayoutCache()
+    frames = Utilities.FrameLimiter(max_fps)
+    movement_keys = [
+        *Key.PAGE_UP,
+        *Key.PAGE_DOWN,
+        *Key.NEXT_CHAPTER,
+        *Key.PREVIOUS_CHAPTER,
+        *Key.START_OF_CHAPTER,
+        *Key.END_OF_CHAPTER
+    ]
+    is_moving = False
 
     if default:
         current_chapter = state.get_chapter()
@@ -94,9 +125,13 @@ def snr(state, fileinput, args, default):
         modes,
         v_padding,
         h_padding,
-        pe_line
+        pe_line,
+        layouts
     )
     current_page = content_pages.get_page_by_index(page_index)
+    toc_pages = None
+    help_pages = None
+    bookmark_pages = None
     index = None
 
     while escape == False:
@@ -124,6 +159,16 @@ def snr(state, fileinput, args, default):
             std_screen.redraw()
             screen_update = False
 
+        if style_update:
+            content_pages.set_modes(modes)
+            if toc_pages is not None:
+                toc_pages.set_modes(modes)
+            if help_pages is not None:
+                help_pages.set_modes(modes)
+            if bookmark_pages is not None:
+                bookmark_pages.set_modes(modes)
+            style_update = False
+
         if content_update:
             content_pages = Screen.ContentPages(screen,
                 book,
@@ -131,48 +176,27 @@ def snr(state, fileinput, args, default):
                 modes,
                 v_padding,
                 h_padding,
-                pe_line
-            )
-            toc_pages = Screen.TocPages(
-                screen,
-                book,
-                current_chapter,
-                modes,
-                v_padding,
-                h_padding
-            )
-            help_pages = Screen.HelpPages(
-                screen,
-                book,
-                current_chapter,
-                modes,
-                v_padding,
-                h_padding
-            )
-            bookmark_pages = Screen.BookmarkPages(
-                screen,
-                book,
-                current_chapter,
-                bookmarks,
-                modes,
-                v_padding,
-                h_padding,
+                pe_line,
+                layouts
             )
             if index is not None:
                 current_page = content_pages.get_page_by_index(index)
                 index = None
             content_update = False
 
-        content_pages.print_page(current_page, bookmarks, quickmarks)
+        if not is_moving or not frames.has_input(screen):
+            content_pages.print_page(current_page, bookmarks, quickmarks)
+            frames.set_frame()
 
         x = screen.getch()
+        is_moving = x in movement_keys
 
         if x in Key.PAGE_UP:
                 if not content_pages.get_double_page():
                     current_page += 1
                 else:
                     current_page += 2
-                if current_page >= content_pages.get_number_of_pages():
+                if not content_pages.has_page(current_page):
                     current_chapter += 1
                     current_page = 0
                     content_update = True
@@ -191,7 +215,8 @@ def snr(state, fileinput, args, default):
                     modes,
                     v_padding,
                     h_padding,
-                    pe_line
+                    pe_line,
+                    layouts
                 )
                 if not content_pages.get_double_page() or content_pages.get_number_of_pages() < 2:
                     current_page = content_pages.get_number_of_pages() - 1
@@ -221,17 +246,17 @@ def snr(state, fileinput, args, default):
         if x in Key.DARK_MODE:
             modes['dark_mode'] = not modes['dark_mode']
             screen_update = True
-            content_update = True
+            style_update = True
 
         if x in Key.SPEED_MODE:
             modes['speed_mode'] = not modes['speed_mode']
             screen_update = True
-            content_update = True
+            style_update = True
 
         if x in Key.HIGHLIGHT:
             modes['highlight'] = not modes['highlight']
             screen_update = True
-            content_update = True
+            style_update = True
 
         if x in Key.DOUBLE_PAGE:
             modes['double_page'] = not modes['double_page']
@@ -258,7 +283,8 @@ def snr(state, fileinput, args, default):
                 modes,
                 v_padding,
                 h_padding,
-                pe_line
+                pe_line,
+                layouts
             )
             current_page = content_pages.get_page_by_index(index)
             screen_update = True
@@ -273,7 +299,8 @@ def snr(state, fileinput, args, default):
                 modes,
                 v_padding,
                 h_padding,
-                pe_line
+                pe_line,
+                layouts
             )
             current_page = content_pages.get_page_by_index(index)
             screen_update = True
@@ -287,7 +314,8 @@ def snr(state, fileinput, args, default):
                 modes,
                 v_padding,
                 h_padding,
-                pe_line
+                pe_line,
+                layouts
             )
             current_page = content_pages.get_page_by_index(index)
             screen_update = True
@@ -302,7 +330,8 @@ def snr(state, fileinput, args, default):
                 modes,
                 v_padding,
                 h_padding,
-                pe_line
+                pe_line,
+                layouts
             )
             current_page = content_pages.get_page_by_index(index)
             screen_update = True
@@ -323,7 +352,8 @@ def snr(state, fileinput, args, default):
                     modes,
                     v_padding,
                     h_padding,
-                    pe_line
+                    pe_line,
+                    layouts
                 )
                 current_page = content_pages.get_page_by_index(quickmarks.get_index(chr(x)))
 
@@ -427,6 +457,17 @@ def snr(state, fileinput, args, default):
                     escape_bookmark = True
 
         if x in Key.BOOKMARK:
+            if bookmark_pages is None \
+                or bookmark_pages.is_outdated(screen, modes, v_padding, h_padding):
+                bookmark_pages = Screen.BookmarkPages(
+                    screen,
+                    book,
+                    current_chapter,
+                    bookmarks,
+                    modes,
+                    v_padding,
+                    h_padding,
+                )
             escape_bookmark = False
             current_bookmark_page = 0
             current_bookmark_pos = 0
@@ -469,7 +510,8 @@ def snr(state, fileinput, args, default):
                             modes,
                             v_padding,
                             h_padding,
-                            pe_line
+                            pe_line,
+                            layouts
                         )
                         current_page = content_pages.get_page_by_index(bookmarks.get_index(bookmark_key))
                     escape_bookmark = True
@@ -526,7 +568,8 @@ def snr(state, fileinput, args, default):
                             modes,
                             v_padding,
                             h_padding,
-                            pe_line
+                            pe_line,
+                            layouts
                         )
                         current_page = content_pages.get_page_by_index(index)
                         current_description_page = 0
@@ -605,7 +648,8 @@ def snr(state, fileinput, args, default):
                                     modes,
                                     v_padding,
                                     h_padding,
-                                    pe_line
+                                    pe_line,
+                                    layouts
                                 )
                                 bookmark_description_pages = Screen.BookmarkDescribePages(
                                     screen,
@@ -670,7 +714,8 @@ def snr(state, fileinput, args, default):
                         modes,
                         v_padding,
                         h_padding,
-                        pe_line
+                        pe_line,
+                        layouts
                     )
                     bookmark_pages = Screen.BookmarkPages(
                         screen,
@@ -686,38 +731,83 @@ def snr(state, fileinput, args, default):
                     current_bookmark_page = 0
 
         if x in Key.TOC:
+            if toc_pages is None or toc_pages.is_outdated(screen, modes, v_padding, h_padding):
+                toc_pages = Screen.TocPages(
+                    screen,
+                    book,
+                    current_chapter,
+                    modes,
+                    v_padding,
+                    h_padding
+                )
+            toc_pages.reset()
             escape_toc = False
-            current_toc_page = 0
-            current_toc_pos = 0
+            is_toc_filter = False
+            toc_number = ''
             while escape_toc == False:
-                toc_pages.print_page(current_toc_page, current_toc_pos)
+                toc_pages.print_page(is_toc_filter, toc_number)
+
+                if is_toc_filter:
+                    y = screen.get_wch()
+
+                    if y in Key.FILTER_ACCEPT:
+                        is_toc_filter = False
+
+                    elif y in Key.FILTER_CANCEL:
+                        toc_pages.set_query('')
+                        is_toc_filter = False
+
+                    elif y in Key.FILTER_DELETE:
+                        if toc_pages.get_query() == '':
+                            is_toc_filter = False
+                        else:
+                            toc_pages.set_query(toc_pages.get_query()[:-1])
+
+                    elif y == curses.KEY_RESIZE:
+                        curses.ungetch(y)
+                        is_toc_filter = False
+
+                    elif isinstance(y, str) and y.isprintable():
+                        toc_pages.set_query(toc_pages.get_query() + y)
+
+                    continue
 
                 y = screen.getch()
 
+                if y in Key.GOTO_NUMBER and (toc_number != '' or y not in Key.START_OF_CHAPTER):
+                    toc_number += chr(y)
+                    if int(toc_number) > number_of_chapters:
+                        toc_number = chr(y).lstrip('0')
+                    if toc_number != '':
+                        toc_pages.move_to_id(int(toc_number))
+                    continue
+
+                toc_number = ''
+
                 if y in Key.PAGE_UP:
-                    current_toc_pos += 1
-                    if current_toc_pos == \
-                        toc_pages.get_number_of_positions(current_toc_page):
-                        current_toc_pos = 0
-                        if current_toc_page < toc_pages.get_number_of_pages() - 1:
-                            current_toc_page += 1
-                        else:
-                            current_toc_page = 0
+                    toc_pages.move(1)
 
                 if y in Key.PAGE_DOWN:
-                    current_toc_pos -= 1
-                    if current_toc_pos == -1:
-                        if current_toc_page > 0:
-                            current_toc_page -= 1
-                        else:
-                            current_toc_page = toc_pages.get_number_of_pages() - 1
-                        current_toc_pos = \
-                            toc_pages.get_number_of_positions(current_toc_page) - 1
+                    toc_pages.move(-1)
 
-                if y in Key.SELECT:
+                if y in Key.NEXT_CHAPTER:
+                    toc_pages.move_page(1)
+
+                if y in Key.PREVIOUS_CHAPTER:
+                    toc_pages.move_page(-1)
+
+                if y in Key.START_OF_CHAPTER:
+                    toc_pages.move_home()
+
+                if y in Key.END_OF_CHAPTER:
+                    toc_pages.move_end()
+
+                if y in Key.FILTER:
+                    is_toc_filter = True
+
+                if y in Key.SELECT and toc_pages.has_matches():
                     current_page = 0
-                    current_chapter = \
-                        toc_pages.get_position_id(current_toc_page, current_toc_pos) - 1
+                    current_chapter = toc_pages.get_position_id() - 1
                     escape_toc = True
                     content_update = True
 
@@ -761,7 +851,8 @@ def snr(state, fileinput, args, default):
                         modes,
                         v_padding,
                         h_padding,
-                        pe_line
+                        pe_line,
+                        layouts
                     )
                     toc_pages = Screen.TocPages(
                         screen,
@@ -773,9 +864,17 @@ def snr(state, fileinput, args, default):
                     )
                     content_pages.print_page(current_page, bookmarks, quickmarks)
                     current_page = content_pages.get_page_by_index(index)
-                    current_toc_page = 0
 
         if x in Key.HELP:
+            if help_pages is None or help_pages.is_outdated(screen, modes, v_padding, h_padding):
+                help_pages = Screen.HelpPages(
+                    screen,
+                    book,
+                    current_chapter,
+                    modes,
+                    v_padding,
+                    h_padding
+                )
             escape_help = False
             current_help_page = 0
             while escape_help == False:
@@ -833,7 +932,8 @@ def snr(state, fileinput, args, default):
                         modes,
                         v_padding,
                         h_padding,
-                        pe_line
+                        pe_line,
+                        layouts
                     )
                     help_pages = Screen.HelpPages(
                         screen,
@@ -847,6 +947,73 @@ def snr(state, fileinput, args, default):
                     current_page = content_pages.get_page_by_index(index)
                     current_help_page = 0
 
+        if x in Key.GOTO:
+            escape_goto = False
+            goto = ''
+            page_map = None
+            while escape_goto == False:
+                if page_map is not None:
+                    if page_map.is_counted(goto_page):
+                        if page_map.has_position(goto_page):
+                            if goto_page is None:
+                                current_chapter, current_page = \
+                                    page_map.get_percent_position(int(goto.rstrip('%')))
+                            else:
+                                current_chapter, current_page = \
+                                    page_map.get_position(goto_page)
+                            content_pages = Screen.ContentPages(
+                                screen,
+                                book,
+                                current_chapter,
+                                modes,
+                                v_padding,
+                                h_padding,
+                                pe_line,
+                                layouts
+                            )
+                            if content_pages.get_double_page():
+                                current_page -= current_page % 2
+                        page_map.release()
+                        escape_goto = True
+                        continue
+                    content_pages.print_page(
+                        current_page,
+                        bookmarks,
+                        quickmarks,
+                        goto=goto + ' counting...'
+                    )
+                    screen.timeout(100)
+                    y = screen.getch()
+                    screen.timeout(-1)
+                    if y in Key.ESCAPE:
+                        page_map.release()
+                        escape_goto = True
+                    continue
+
+                content_pages.print_page(
+                    current_page,
+                    bookmarks,
+                    quickmarks,
+                    goto=goto
+                )
+
+                y = screen.getch()
+
+                if y in Key.GOTO_NUMBER and not goto.endswith('%'):
+                    goto += chr(y)
+
+                if y in Key.GOTO_PERCENT and goto != '' and not goto.endswith('%'):
+                    goto += chr(y)
+
+                if y in Key.SELECT and goto.rstrip('%') != '':
+                    goto_page = None if goto.endswith('%') else int(goto) - 1
+                    page_map = content_pages.get_page_map()
+                    page_map.request(goto_page)
+                    continue
+
+                if y not in [*Key.GOTO_NUMBER, *Key.GOTO_PERCENT]:
+                    escape_goto = True
+
         if x in Key.REFRESH:
             curses.endwin()
             std_screen = Screen.Screen(
@@ -2,3 +2,7 @@
 
 from .quickmarks import Quickmarks
 from .bookmarks import Bookmarks
+from .lru_cache import LruCache
+from .line_breaker import LineBreaker
+from .hyphenation_memo import HyphenationMemo
+from .frame_limiter import FrameLimiter
@@ -8,6 +8,7 @@ from subprocess import Popen
 class Bookmarks:
     def __init__(self, bookmarks=None):
         self.bookmarks = self._set_bookmarks(bookmarks)
+        self.version = 0
         self._set_editor()
         self._set_template()
 
@@ -37,6 +38,7 @@ class Bookmarks:
             'chapter': chapter,
             'index': index
         }
+        self.version += 1
 
     def get_bookmarks(self):
         return self.bookmarks
@@ -47,6 +49,9 @@ class Bookmarks:
     def get_index(self, key):
         return self.bookmarks[key]['index']
 
+    def get_version(self):
+        return self.version
+
     def get_keys(self):
         return self.bookmarks.keys()
 
@@ -72,6 +77,7 @@ class Bookmarks:
         for index, key in enumerate(self.bookmarks.keys()):
             new_bookmarks[str(index)] = self.bookmarks[key]
         self.bookmarks = new_bookmarks
+        self.version += 1
 
     def edit(self, key):
         with tempfile.NamedTemporaryFile(suffix='.tmp') as f:
@@ -96,6 +102,7 @@ class Bookmarks:
             if len(name) != 0:
                 self.bookmarks[key]['name'] = name
             self.bookmarks[key]['description'] = description
+            self.version += 1
 
     def has_bookmarks(self):
         return True if len(self.bookmarks) > 0 else False
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+
+import curses
+import time
+
+class FrameLimiter:
+    def __init__(self, max_fps=0):
+        self.frame_time = 1 / max_fps if max_fps > 0 else 0
+        self.last_frame = 0
+
+    def set_frame(self):
+        self.last_frame = time.monotonic()
+
+    def has_input(self, screen):
+        delay = self.last_frame + self.frame_time - time.monotonic()
+        screen.timeout(max(int(delay * 1000), 0))
+        key = screen.getch()
+        screen.timeout(-1)
+        if key == -1:
+            return False
+        curses.ungetch(key)
+        return True
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+from .lru_cache import LruCache
+
+class HyphenationMemo:
+    def __init__(self, hyphenator, words=None, max_size=50000):
+        self.hyphenator = hyphenator
+        self.pairs_cache = LruCache(max_size)
+        self.is_changed = False
+        self._set_words(words)
+
+    def _set_words(self, words):
+        try:
+            for word, pairs in words or []:
+                self.pairs_cache.set(word, pairs)
+        except (TypeError, ValueError):
+            self.pairs_cache.clear()
+
+    def get_words(self):
+        return [[word, pairs] for word, pairs in self.pairs_cache.get_items()]
+
+    def has_changed(self):
+        return self.is_changed
+
+    def pairs(self, word):
+        pairs = self.pairs_cache.get(word)
+        if pairs is None:
+            pairs = self.hyphenator.pairs(word)
+            self.pairs_cache.set(word, pairs)
+            self.is_changed = True
+        return [list(pair) for pair in pairs]
+
+    def syllables(self, word):
+        return self.hyphenator.syllables(word)
+
+    def wrap(self, word, width, hyphen='-'):
+        p = self.pairs(word)
+        max_chars = width - len(hyphen)
+        while p:
+            if p[-1][0].endswith(hyphen):
+                cur_max_chars = max_chars + 1
+            else:
+                cur_max_chars = max_chars
+            if len(p[-1][0]) > cur_max_chars:
+                p.pop()
+            else:
+                break
+        if p:
+            if cur_max_chars == max_chars:
+                p[-1][0] += hyphen
+            return p[-1]
+        return []
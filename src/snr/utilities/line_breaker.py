@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+import re
+from textwrap import TextWrapper
+
+class LineBreaker:
+    def __init__(self, width):
+        self.width = width
+        self.wrapper = TextWrapper(width)
+        self.spaces = re.compile(r'( +)')
+        self.irregular = re.compile(r'[^\S ]|-|  |^ | $')
+        self.whitespace = str.maketrans('\n\x0b\x0c\r', '    ')
+
+    # :::: GETTERS ::::::::::::::::: #
+
+    def _get_chunks(self, text):
+        chunks = []
+        for chunk in self.spaces.split(text):
+            if '-' in chunk:
+                chunks.extend(self.wrapper.wordsep_re.split(chunk))
+            else:
+                chunks.append(chunk)
+        return [chunk for chunk in chunks if chunk]
+
+    # :::: OTHER ::::::::::::::::::: #
+
+    def _wrap_words(self, words, lengths):
+        lines = []
+        start = 0
+        line_len = -1
+        for index, word_len in enumerate(lengths):
+            if line_len + 1 + word_len <= self.width:
+                line_len += 1 + word_len
+            else:
+                lines.append(' '.join(words[start:index]))
+                start = index
+                line_len = word_len
+        lines.append(' '.join(words[start:]))
+        return lines
+
+    def _wrap_chunks(self, chunks):
+        lengths = [len(chunk) for chunk in chunks]
+        number_of_chunks = len(chunks)
+        lines = []
+        index = 0
+        while index < number_of_chunks:
+            if lines and chunks[index].strip() == '':
+                index += 1
+            line = []
+            line_len = 0
+            while index < number_of_chunks and line_len + lengths[index] <= self.width:
+                line.append(chunks[index])
+                line_len += lengths[index]
+                index += 1
+            if index < number_of_chunks and lengths[index] > self.width:
+                chunk = chunks[index]
+                end = self.width - line_len
+                hyphen = chunk.rfind('-', 0, end)
+                if hyphen > 0 and any(c != '-' for c in chunk[:hyphen]):
+                    end = hyphen + 1
+                line.append(chunk[:end])
+                chunks[index] = chunk[end:]
+                lengths[index] -= end
+            if line and line[-1].strip() == '':
+                del line[-1]
+            if line:
+                lines.append(''.join(line))
+        return lines
+
+    def wrap(self, text):
+        if self.width <= 0:
+            return self.wrapper.wrap(text)
+        text = text.expandtabs().translate(self.whitespace)
+        if text == '':
+            return []
+        if not self.irregular.search(text):
+            words = text.split(' ')
+            lengths = [len(word) for word in words]
+            if max(lengths) <= self.width:
+                return self._wrap_words(words, lengths)
+        return self._wrap_chunks(self._get_chunks(text))
+
+    def justify(self, line):
+        words = line.split(' ')
+        words_len = sum(len(word) for word in words)
+        if words_len < int(self.width / 1.6):
+            return line
+        gaps = len(words) - 1
+        extra = self.width - words_len - gaps
+        if gaps == 0 or extra <= 0:
+            return line
+        space, wide_gaps = divmod(extra, gaps)
+        narrow = ' ' * (space + 1)
+        wide = ' ' * (space + 2)
+        narrow_words = gaps - wide_gaps + 1
+        just_line = narrow.join(words[:narrow_words])
+        if wide_gaps:
+            just_line += wide + wide.join(words[narrow_words:])
+        return just_line
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# Compares LineBreaker against textwrap.wrap and the previous justify loop
+# on a synthetic book. Run with: python -m snr.utilities.line_breaker_benchmark
+
+import argparse
+import random
+import textwrap
+import time
+from .line_breaker import LineBreaker
+
+LETTERS = 'etaoinshrdlucmfwyp'
+WORD_LENGTHS = [1, 2, 2, 3, 3, 4, 4, 4, 5, 5, 6, 7, 8, 9, 11]
+
+def loop_justify(line, width):
+    just_line = []
+    words = line.split(' ')
+    words_len = sum(len(word) for word in words)
+    if words_len < int(width / 1.6):
+        return line
+    spaces_number = len(words) - 1
+    spaces = [1 for _ in range(spaces_number)]
+    index = 0
+    if spaces:
+        while words_len + spaces_number < width:
+            spaces[len(spaces) - index - 1] += 1
+            spaces_number += 1
+            index = (index + 1) % len(spaces)
+    for index, word in enumerate(words):
+        just_line.append(word)
+        if index < len(spaces):
+            just_line.append(' ' * spaces[index])
+    return ''.join(just_line)
+
+def get_paragraphs(number_of_paragraphs, hyphens, seed):
+    rand = random.Random(seed)
+    vocabulary = [
+        ''.join(rand.choice(LETTERS) for _ in range(rand.choice(WORD_LENGTHS)))
+        for _ in range(3000)
+    ]
+    def get_word():
+        word = rand.choice(vocabulary)
+        roll = rand.random()
+        if roll < hyphens:
+            word += '-' + rand.choice(vocabulary)
+        elif roll < 0.1:
+            word += ','
+        elif roll < 0.15:
+            word += '.'
+        return word
+    return [
+        ' '.join(get_word() for _ in range(rand.randint(5, 120)))
+        for _ in range(number_of_paragraphs)
+    ]
+
+def get_best_time(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best * 1000
+
+def print_result(name, old_name, old_time, new_name, new_time):
+    print('{:<10}{} {:.1f} ms -> {} {:.1f} ms (x{:.2f})'.format(
+        name, old_name, old_time, new_name, new_time, old_time / new_time
+    ))
+
+def main():
+    parser = argparse.ArgumentParser(description='LineBreaker benchmark')
+    parser.add_argument('-c', '--columns', type=int, default=64)
+    parser.add_argument('-p', '--paragraphs', type=int, default=2000)
+    parser.add_argument('-H', '--hyphens', type=float, default=0.03,
+                        help='share of hyphenated words')
+    parser.add_argument('-r', '--repeat', type=int, default=7)
+    parser.add_argument('-s', '--seed', type=int, default=3)
+    args = parser.parse_args()
+
+    paragraphs = get_paragraphs(args.paragraphs, args.hyphens, args.seed)
+    line_breaker = LineBreaker(args.columns)
+    lines = [line for paragraph in paragraphs for line in textwrap.wrap(paragraph, args.columns)]
+
+    if [line_breaker.wrap(paragraph) for paragraph in paragraphs] \
+            != [textwrap.wrap(paragraph, args.columns) for paragraph in paragraphs]:
+        print('wrap output differs from textwrap')
+    if [line_breaker.justify(line) for line in lines] \
+            != [loop_justify(line, args.columns) for line in lines]:
+        print('justify output differs from the loop')
+
+    print('words {} paragraphs {} lines {} columns {}'.format(
+        sum(len(paragraph.split(' ')) for paragraph in paragraphs),
+        len(paragraphs),
+        len(lines),
+        args.columns
+    ))
+    print_result(
+        'wrap',
+        'textwrap',
+        get_best_time(lambda: [textwrap.wrap(paragraph, args.columns) for paragraph in paragraphs], args.repeat),
+        'LineBreaker',
+        get_best_time(lambda: [line_breaker.wrap(paragraph) for paragraph in paragraphs], args.repeat)
+    )
+    print_result(
+        'justify',
+        'loop',
+        get_best_time(lambda: [loop_justify(line, args.columns) for line in lines], args.repeat),
+        'closed form',
+        get_best_time(lambda: [line_breaker.justify(line) for line in lines], args.repeat)
+    )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+import threading
+from collections import OrderedDict
+
+class LruCache:
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.items:
+                return default
+            self.items.move_to_end(key)
+            return self.items[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            while self.max_size is not None and len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+    def get_items(self):
+        with self.lock:
+            return list(self.items.items())
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
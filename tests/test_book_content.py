@@ -0,0 +1,185 @@
+import random
+import zipfile
+import pytest
+from bs4 import BeautifulSoup
+from snr.reader import FileReader
+from snr.parser import BookContent
+
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+STYLE_TAGS = ['span', 'i', 'b', 'em', 'strong', 'a', 'blockquote']
+
+MODES = [
+    {},
+    {'lazy_parsing': True},
+    {'lxml_parser': True},
+    {'lazy_parsing': True, 'lxml_parser': True},
+]
+
+PREFIX_BOOK = (
+    [
+        ('Text/one.xhtml', '<p>prefix text 1</p><h2 id="a">First</h2><p>first</p>'
+            '<h2 id="b">Second</h2><p>second</p>'),
+        ('Text/two.xhtml', '<p>prefix text 2</p><h2 id="c">Third</h2><p>third</p>'),
+    ],
+    [
+        ('One', 'Text/one.xhtml'),
+        ('First', 'Text/one.xhtml#a'),
+        ('Second', 'Text/one.xhtml#b'),
+        ('Two', 'Text/two.xhtml'),
+        ('Third', 'Text/two.xhtml#c'),
+    ]
+)
+
+
+def write_epub(path, documents, navigation):
+    nav_points = ''.join(
+        '<navPoint id="n{0}" playOrder="{0}"><navLabel><text>{1}</text></navLabel>'
+        '<content src="{2}"/></navPoint>'.format(index + 1, name, src)
+        for index, (name, src) in enumerate(navigation)
+    )
+    opf = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="id">'
+        '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        '<dc:title>Book</dc:title><dc:language>en</dc:language></metadata><manifest>'
+        '<item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>'
+        + ''.join(
+            '<item id="d{}" href="{}" media-type="application/xhtml+xml"/>'.format(index, name)
+            for index, (name, body) in enumerate(documents)
+        )
+        + '</manifest><spine toc="ncx">'
+        + ''.join('<itemref idref="d{}"/>'.format(index) for index in range(len(documents)))
+        + '</spine><guide><reference type="text" href="{}" title="Text"/></guide>'
+        '</package>'.format(documents[0][0])
+    )
+    ncx = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">'
+        '<head/><docTitle><text>Book</text></docTitle><navMap>' + nav_points + '</navMap></ncx>'
+    )
+    with zipfile.ZipFile(str(path), 'w') as archive:
+        archive.writestr('mimetype', 'application/epub+zip')
+        archive.writestr(
+            'META-INF/container.xml',
+            '<?xml version="1.0"?><container version="1.0" '
+            'xmlns="urn:oasis:names:tc:opendocument:xmlns:container"><rootfiles>'
+            '<rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>'
+            '</rootfiles></container>'
+        )
+        archive.writestr('OEBPS/content.opf', opf)
+        archive.writestr('OEBPS/toc.ncx', ncx)
+        for name, body in documents:
+            archive.writestr(
+                'OEBPS/' + name,
+                '<?xml version="1.0" encoding="utf-8"?>'
+                '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>t</title></head>'
+                '<body>' + body + '</body></html>'
+            )
+
+
+def get_random_book(seed):
+    rand = random.Random(seed)
+    documents = []
+    navigation = []
+    for document in range(rand.randint(1, 5)):
+        name = 'Text/d{}.xhtml'.format(document)
+        body = ''
+        if rand.random() < 0.7:
+            body += ''.join(
+                '<p>prefix text {}-{}</p>'.format(document, line)
+                for line in range(rand.randint(1, 3))
+            )
+        anchors = []
+        for anchor in range(rand.randint(0, 4)):
+            title = rand.choice(['Part {}-{}'.format(document, anchor), 'Shared'])
+            tag_id = 'a{}-{}'.format(document, anchor)
+            kind = rand.random()
+            if kind < 0.4:
+                body += '<h2 id="{}">{}</h2>'.format(tag_id, title)
+            elif kind < 0.6:
+                body += '<h2>{}</h2>'.format(title)
+                tag_id = None
+            elif kind < 0.8:
+                body += '<p id="{0}">anchor {0}</p>'.format(tag_id)
+            else:
+                body += '<div id="{}"><p>in div</p></div>'.format(tag_id)
+            body += ''.join(
+                '<p>text {}-{}-{}</p>'.format(document, anchor, line)
+                for line in range(rand.randint(0, 3))
+            )
+            anchors.append((title, tag_id))
+        documents.append((name, body))
+        if anchors == [] or rand.random() < 0.8:
+            navigation.append((rand.choice(['Doc {}'.format(document), 'Shared']), name))
+        for title, tag_id in anchors:
+            if rand.random() < 0.7:
+                target = tag_id if tag_id is not None else 'missing'
+                navigation.append((rand.choice([title, 'Other']), name + '#' + target))
+    return documents, navigation
+
+
+def get_baseline_texts(reader, toc_list):
+    texts = []
+    has_content = False
+    current_id = ''
+    for item in toc_list:
+        text = []
+        if not item['is_container']:
+            if item['inner_id'] is not None:
+                current_id = item['inner_id']
+            for path in item['src']:
+                body = BeautifulSoup(reader.read_file(path), 'html.parser').body
+                paragraph_tags = ['p'] if body.find_all('p') != [] else ['p', 'div']
+                for tag in body.find_all():
+                    if tag.name in HEADING_TAGS or tag.has_attr('id'):
+                        has_content = tag.text == item['name'] or tag.get('id') == current_id
+                    if item['inner_id'] is not None and not has_content:
+                        continue
+                    is_paragraph = tag.name in paragraph_tags or (
+                        tag.name in STYLE_TAGS
+                        and tag.parent.name not in paragraph_tags
+                        and tag.parent.name not in STYLE_TAGS
+                    )
+                    paragraph = tag.text.lstrip()
+                    if is_paragraph and paragraph != '' and paragraph != '\xa0':
+                        text.append(paragraph)
+        texts.append(text)
+    return texts
+
+
+def get_chapter_texts(path, mode):
+    reader = FileReader(str(path))
+    toc_file = reader.get_toc_file()
+    book = BookContent(
+        reader,
+        reader.get_directory_path(toc_file),
+        toc_file,
+        reader.get_content_file(),
+        False,
+        'en_US',
+        **mode
+    )
+    chapters = range(book.get_number_of_chapters())
+    if book.is_lazy_parsing():
+        texts = {chapter: book.get_chapter_text(chapter) for chapter in reversed(chapters)}
+    else:
+        texts = {chapter: book.get_chapter_text(chapter) for chapter in chapters}
+    return [texts[chapter] for chapter in chapters], get_baseline_texts(reader, book.get_toc_list())
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_document_prefix_follows_previous_chapter(tmp_path, mode):
+    path = tmp_path / 'prefix.epub'
+    write_epub(path, *PREFIX_BOOK)
+    texts, expected = get_chapter_texts(path, mode)
+    assert texts == expected
+    assert texts[4] == ['prefix text 2', 'third']
+
+
+@pytest.mark.parametrize('mode', MODES)
+@pytest.mark.parametrize('seed', range(40))
+def test_chapter_texts_match_baseline_rules(tmp_path, mode, seed):
+    path = tmp_path / 'book.epub'
+    write_epub(path, *get_random_book(seed))
+    texts, expected = get_chapter_texts(path, mode)
+    assert texts == expected
@@ -0,0 +1,45 @@
+import pytest
+from snr.parser.document import Document
+
+FRAGMENTS = [
+    '<p>plain text</p>',
+    '<p>a<!-- comment -->b</p>',
+    '<!-- <p>commented out</p> --><p>kept</p>',
+    '<p><script>var x = 1;</script>after script</p>',
+    '<style>p { color: red; }</style><p>styled</p>',
+    '<p><template>hidden</template>shown</p>',
+    '<script id="s">x</script><p>marker</p>',
+    '<p>&amp; &lt;tag&gt; &#8212; &#x2014; &nbsp;</p>',
+    '<P>Upper paragraph</P><DIV>upper div</DIV>',
+    '<DIV><SPAN>upper span</SPAN> tail</DIV>',
+    '<p>a <i>b <b>c</b> d</i> e</p>',
+    '<p>one</p>tail between<p>two</p>',
+    '<div><span>span</span> tail text</div>',
+    '<blockquote>quote<p>inner</p></blockquote>',
+    '<p>before<pre>  kept\n  spacing</pre>after</p>',
+    '<p>   </p><p>\xa0</p><p>  leading space</p>',
+    '<h1 id="one">Title</h1><p>first</p><h2>Sub</h2><p>second</p>',
+    '<p id="anchor">anchored <a id="inner">link</a> text</p>',
+    '<div>no paragraphs <i>here</i></div><div>second div</div>',
+    '<div>' * 300 + '<p>deeply nested</p>' + '</div>' * 300,
+]
+
+
+def markup(body):
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<html xmlns="http://www.w3.org/1999/xhtml">'
+        '<head><title>t</title></head>'
+        '<body>' + body + '</body></html>'
+    )
+
+
+@pytest.mark.parametrize('fragment', FRAGMENTS)
+def test_lxml_parser_matches_html_parser(fragment):
+    expected = Document(markup(fragment))
+    document = Document(markup(fragment), lxml_parser=True)
+    assert document.paragraphs == expected.paragraphs
+    assert document.prefix == expected.prefix
+    assert document.segments == expected.segments
+    assert document.names == expected.names
+    assert document.ids == expected.ids
@@ -0,0 +1,45 @@
+import zipfile
+import pytest
+from snr.reader import FileReader
+
+CONTAINER = (
+    '<?xml version="1.0"?><container version="1.0" '
+    'xmlns="urn:oasis:names:tc:opendocument:xmlns:container"><rootfiles>'
+    '<rootfile full-path="missing.opf" media-type="application/oebps-package+xml"/>'
+    '<rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>'
+    '</rootfiles></container>'
+)
+
+MANIFEST = (
+    '<item id="first" href="first.ncx" media-type="application/x-dtbncx+xml"/>'
+    '<item id="second" href="second%20toc.ncx" media-type="application/x-dtbncx+xml"/>'
+    '<item id="missing" href="missing.ncx" media-type="application/x-dtbncx+xml"/>'
+)
+
+
+def write_epub(path, spine, namespace=' xmlns="http://www.idpf.org/2007/opf"'):
+    with zipfile.ZipFile(str(path), 'w') as archive:
+        archive.writestr('META-INF/container.xml', CONTAINER)
+        archive.writestr(
+            'OEBPS/content.opf',
+            '<?xml version="1.0"?><package{}><manifest>{}</manifest>{}'
+            '<itemref idref="text"/></spine></package>'.format(namespace, MANIFEST, spine)
+        )
+        archive.writestr('OEBPS/first.ncx', '<ncx/>')
+        archive.writestr('OEBPS/second toc.ncx', '<ncx/>')
+
+
+@pytest.mark.parametrize('spine, toc_file', [
+    ('<spine toc="second">', 'OEBPS/second toc.ncx'),
+    ('<spine toc="first">', 'OEBPS/first.ncx'),
+    ('<spine>', 'OEBPS/first.ncx'),
+    ('<spine toc="missing">', 'OEBPS/first.ncx'),
+    ('<spine toc="unknown">', 'OEBPS/first.ncx'),
+])
+@pytest.mark.parametrize('namespace', [' xmlns="http://www.idpf.org/2007/opf"', ''])
+def test_toc_file_prefers_spine_toc_then_first_ncx(tmp_path, spine, toc_file, namespace):
+    path = tmp_path / 'book.epub'
+    write_epub(path, spine, namespace)
+    reader = FileReader(str(path))
+    assert reader.get_content_file() == 'OEBPS/content.opf'
+    assert reader.get_toc_file() == toc_file